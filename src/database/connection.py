@@ -9,13 +9,15 @@ from src.config import Config
 class Database:
     """SQLite database connection manager."""
 
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, uri: bool = False):
         self.db_path = db_path or Config.DATABASE_PATH
+        # Open db_path as a SQLite URI (e.g. "file:name?mode=memory")
+        self.uri = uri
 
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, uri=self.uri)
         conn.row_factory = sqlite3.Row  # Enable column access by name
         conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign keys
         try:
@@ -34,6 +34,27 @@ def sanitize_url(url, default_url):
     return url
 
 
+def validate_file_content(file_bytes, mime_type):
+    """Check uploaded bytes match the declared MIME type.
+
+    Returns an error message for the client, or None if the content is valid.
+    """
+    if mime_type == "application/pdf":
+        if not file_bytes.startswith(b"%PDF"):
+            return "Invalid PDF file"
+    elif mime_type in ["image/jpeg", "image/png", "image/webp"]:
+        try:
+            img = Image.open(BytesIO(file_bytes))
+            img.verify()  # Verify integrity
+            if mime_type == "image/jpeg" and img.format != "JPEG":
+                return "Invalid JPEG file"
+            if mime_type == "image/png" and img.format != "PNG":
+                return "Invalid PNG file"
+        except Exception:
+            return "Invalid image file"
+    return None
+
+
 def process_pdf_content(pdf_bytes, max_pages=150):
     """
     Intelligently processes PDF content for LLMs.
@@ -871,6 +892,7 @@ def advisor_chat():
 
         # Get API keys from user account (not profile)
         api_keys = current_user.api_keys_dict
+        data_dict = profile.data_dict
 
         # Determine provider: priority = request > account preference > Gemini (if key exists)
         provider = requested_provider or api_keys.get("preferred_ai_provider") or data_dict.get("preferred_ai_provider")
@@ -1175,20 +1197,9 @@ def extract_items(item_type):
     # 2. Validate File Content (Magic Bytes)
     try:
         file_bytes = base64.b64decode(image_b64)
-        
-        if mime_type == "application/pdf":
-            if not file_bytes.startswith(b"%PDF"):
-                return jsonify({"error": "Invalid PDF file"}), 400
-        elif mime_type in ["image/jpeg", "image/png", "image/webp"]:
-            try:
-                img = Image.open(BytesIO(file_bytes))
-                img.verify() # Verify integrity
-                if mime_type == "image/jpeg" and img.format != "JPEG":
-                     return jsonify({"error": "Invalid JPEG file"}), 400
-                if mime_type == "image/png" and img.format != "PNG":
-                     return jsonify({"error": "Invalid PNG file"}), 400
-            except Exception:
-                return jsonify({"error": "Invalid image file"}), 400
+        content_error = validate_file_content(file_bytes, mime_type)
+        if content_error:
+            return jsonify({"error": content_error}), 400
     except Exception as e:
         return jsonify({"error": f"Invalid file content: {str(e)}"}), 400
 
@@ -28,6 +28,64 @@ def safe_float(value, default=0.0):
         return default
 
 
+# 2024 federal income tax brackets as (lower, upper, rate). Statuses without
+# their own schedule (e.g. 'mfs') fall back to MFJ.
+_FEDERAL_BRACKETS_2024 = {
+    "single": [
+        (0, 11600, 0.10),
+        (11600, 47150, 0.12),
+        (47150, 100525, 0.22),
+        (100525, 191950, 0.24),
+        (191950, 243725, 0.32),
+        (243725, 609350, 0.35),
+        (609350, float("inf"), 0.37),
+    ],
+    "hoh": [
+        (0, 16550, 0.10),
+        (16550, 63100, 0.12),
+        (63100, 100500, 0.22),
+        (100500, 191950, 0.24),
+        (191950, 243700, 0.32),
+        (243700, 609350, 0.35),
+        (609350, float("inf"), 0.37),
+    ],
+    "mfj": [  # Default for retired couples
+        (0, 23200, 0.10),
+        (23200, 94300, 0.12),
+        (94300, 201050, 0.22),
+        (201050, 383900, 0.24),
+        (383900, 487450, 0.32),
+        (487450, 731200, 0.35),
+        (731200, float("inf"), 0.37),
+    ],
+}
+
+
+def _bracket_lookup_arrays(brackets):
+    """Turn (lower, upper, rate) brackets into arrays for a searchsorted lookup.
+
+    Returns (lowers, slot_lowers, slot_rates, slot_base_tax). The slot arrays
+    have a leading zero slot for non-positive income; slot i + 1 holds bracket
+    i's lower bound, rate and the total tax owed on income below it.
+    """
+    lowers, uppers, rates = (np.array(col, dtype=float) for col in zip(*brackets))
+    base_tax = np.concatenate(([0.0], np.cumsum((uppers - lowers)[:-1] * rates[:-1])))
+    return (
+        lowers,
+        np.concatenate(([0.0], lowers)),
+        np.concatenate(([0.0], rates)),
+        np.concatenate(([0.0], base_tax)),
+    )
+
+
+# Lookup arrays built once at import rather than on every call from the
+# Monte Carlo year loop.
+_FEDERAL_BRACKET_ARRAYS = {
+    status: _bracket_lookup_arrays(brackets)
+    for status, brackets in _FEDERAL_BRACKETS_2024.items()
+}
+
+
 @dataclass
 class Person:
     name: str
@@ -102,6 +160,83 @@ class MarketAssumptions:
     ss_discount_rate: float = 0.03
 
 
+# IRS Uniform Lifetime Table divisors, indexed by age - _RMD_START_AGE. Ages
+# not in the table use the last divisor.
+_RMD_START_AGE = 73
+_RMD_DIVISORS = np.array(
+    [
+        26.5,  # 73
+        25.5,
+        24.6,
+        23.7,
+        22.9,
+        22.0,
+        21.1,
+        20.2,
+        19.4,
+        18.5,
+        17.7,
+        16.8,
+        16.0,
+        15.2,
+        14.4,
+        13.7,
+        12.9,
+        12.2,  # 90+
+    ]
+)
+
+
+def _rmd_divisor(age):
+    """Uniform Lifetime divisor for an age at or past _RMD_START_AGE.
+
+    Only whole-year ages (73 or 73.0) are in the table; fractional ages and
+    ages past 90 get the last divisor.
+    """
+    offset = age - _RMD_START_AGE
+    if offset == int(offset) and offset < len(_RMD_DIVISORS):
+        return float(_RMD_DIVISORS[int(offset)])
+    return float(_RMD_DIVISORS[-1])
+
+
+# Provisional income thresholds for Social Security taxation: up to 50% of
+# benefits taxable above the first, up to 85% above the second
+_SS_TAXATION_THRESHOLDS = {
+    "mfj": (32000.0, 44000.0),
+    "single": (25000.0, 34000.0),  # Also used for hoh
+}
+
+# 2024 LTCG thresholds (taxable income including gains): 0% up to the first,
+# 15% up to the second, 20% above
+_LTCG_THRESHOLDS_2024 = {
+    "mfj": (94050.0, 583750.0),
+    "single": (47025.0, 518900.0),  # Also used for hoh
+}
+
+# 2024 IRMAA tiers (Part B + Part D combined annual surcharge per person): the
+# MAGI upper bound of each tier below the top, and the surcharge for every tier
+_IRMAA_TIERS_2024 = {
+    "mfj": (
+        np.array([206000, 258000, 322000, 386000, 750000], dtype=float),
+        np.array([0, 839.40, 2097.60, 3355.20, 4612.80, 5030.40]),
+    ),
+    "single": (  # Also used for hoh
+        np.array([103000, 129000, 161000, 193000, 500000], dtype=float),
+        np.array([0, 839.40, 2097.60, 3355.20, 4612.80, 5030.40]),
+    ),
+}
+
+# 2024 FICA: Social Security tax applies up to the wage base, Medicare on all wages
+_SS_WAGE_BASE = 168600.0
+_SS_TAX_RATE = 0.062
+_MEDICARE_TAX_RATE = 0.0145
+
+
+def _fica_tax(wages):
+    """FICA on employment wages, with the Social Security wage-base cap."""
+    return np.minimum(wages, _SS_WAGE_BASE) * _SS_TAX_RATE + wages * _MEDICARE_TAX_RATE
+
+
 class RetirementModel:
     def __init__(self, profile: FinancialProfile):
         self.profile = profile
@@ -141,47 +276,20 @@ class RetirementModel:
         if filing_status is None:
             filing_status = getattr(self.profile, "filing_status", "mfj")
 
-        # 2024 MFJ brackets (default) - can be extended for other statuses
-        if filing_status == "single":
-            brackets = [
-                (0, 11600, 0.10),
-                (11600, 47150, 0.12),
-                (47150, 100525, 0.22),
-                (100525, 191950, 0.24),
-                (191950, 243725, 0.32),
-                (243725, 609350, 0.35),
-                (609350, float("inf"), 0.37),
-            ]
-        elif filing_status == "hoh":
-            brackets = [
-                (0, 16550, 0.10),
-                (16550, 63100, 0.12),
-                (63100, 100500, 0.22),
-                (100500, 191950, 0.24),
-                (191950, 243700, 0.32),
-                (243700, 609350, 0.35),
-                (609350, float("inf"), 0.37),
-            ]
-        else:  # MFJ (default for retired couples)
-            brackets = [
-                (0, 23200, 0.10),
-                (23200, 94300, 0.12),
-                (94300, 201050, 0.22),
-                (201050, 383900, 0.24),
-                (383900, 487450, 0.32),
-                (487450, 731200, 0.35),
-                (731200, float("inf"), 0.37),
-            ]
-
-        total_tax = np.zeros_like(taxable_income, dtype=float)
-        marginal_rate = np.zeros_like(taxable_income, dtype=float)
-
-        for lower, upper, rate in brackets:
-            # Income in this bracket
-            in_bracket = np.clip(taxable_income - lower, 0, upper - lower)
-            total_tax += in_bracket * rate
-            # Update marginal rate for incomes above this bracket's lower bound
-            marginal_rate = np.where(taxable_income > lower, rate, marginal_rate)
+        lowers, slot_lowers, slot_rates, slot_base_tax = _FEDERAL_BRACKET_ARRAYS.get(
+            filing_status, _FEDERAL_BRACKET_ARRAYS["mfj"]
+        )
+
+        # One pass to find each income's bracket: side="left" puts income
+        # exactly on a bracket's lower bound in the bracket below, and
+        # non-positive income in the zero slot.
+        slot = np.searchsorted(lowers, taxable_income, side="left")
+        marginal_rate = slot_rates[slot]
+
+        # Accumulate in place: one result array instead of a temporary per step
+        total_tax = taxable_income - slot_lowers[slot]
+        total_tax *= marginal_rate
+        total_tax += slot_base_tax[slot]
 
         return total_tax, marginal_rate
 
@@ -211,34 +319,20 @@ class RetirementModel:
         provisional = other_income + (ss_benefit * 0.5)
 
         # Thresholds depend on filing status
-        if filing_status == "mfj":
-            threshold_1 = 32000  # Below: 0% taxable
-            threshold_2 = 44000  # Above: up to 85% taxable
-        else:  # single/hoh
-            threshold_1 = 25000
-            threshold_2 = 34000
-
-        # Calculate taxable portion (complex IRS formula simplified)
-        taxable_ss = np.zeros_like(ss_benefit)
-
-        # Between threshold_1 and threshold_2: up to 50% taxable
-        in_middle = (provisional > threshold_1) & (provisional <= threshold_2)
-        excess_1 = np.maximum(0, provisional - threshold_1)
-        taxable_ss = np.where(
-            in_middle, np.minimum(ss_benefit * 0.5, excess_1 * 0.5), taxable_ss
-        )
-
-        # Above threshold_2: up to 85% taxable
-        above_threshold_2 = provisional > threshold_2
-        excess_2 = np.maximum(0, provisional - threshold_2)
-        # Start with 50% of amount between thresholds
-        base_taxable = (threshold_2 - threshold_1) * 0.5
-        # Add 85% of excess above threshold_2
-        additional = excess_2 * 0.85
-        max_85 = ss_benefit * 0.85
-        taxable_ss = np.where(
-            above_threshold_2, np.minimum(max_85, base_taxable + additional), taxable_ss
-        )
+        threshold_1, threshold_2 = _SS_TAXATION_THRESHOLDS[
+            "mfj" if filing_status == "mfj" else "single"
+        ]
+
+        # Calculate taxable portion (complex IRS formula simplified):
+        # 50% of provisional income between the thresholds plus 85% of the
+        # excess above threshold_2, capped at 50% of benefits in the middle
+        # band and 85% above it
+        taxable_ss = np.clip(provisional - threshold_1, 0, threshold_2 - threshold_1)
+        taxable_ss *= 0.5
+        taxable_ss += 0.85 * np.maximum(0, provisional - threshold_2)
+        cap = np.where(provisional > threshold_2, 0.85, 0.5)
+        cap *= ss_benefit
+        taxable_ss = np.minimum(taxable_ss, cap)
 
         return taxable_ss
 
@@ -260,16 +354,9 @@ class RetirementModel:
         if filing_status is None:
             filing_status = getattr(self.profile, "filing_status", "mfj")
 
-        # 2024 LTCG brackets (thresholds for total taxable income including gains)
-        if filing_status == "mfj":
-            threshold_0 = 94050  # 0% up to here
-            threshold_15 = 583750  # 15% up to here, 20% above
-        else:  # single/hoh
-            threshold_0 = 47025
-            threshold_15 = 518900
-
-        total_income = ordinary_income + gains
-        ltcg_tax = np.zeros_like(gains)
+        threshold_0, threshold_15 = _LTCG_THRESHOLDS_2024[
+            "mfj" if filing_status == "mfj" else "single"
+        ]
 
         # Calculate how much of gains falls in each bracket
         # Gains "stack" on top of ordinary income
@@ -285,13 +372,8 @@ class RetirementModel:
         gains_at_15 = np.minimum(remaining_gains, room_15)
         remaining_gains = remaining_gains - gains_at_15
 
-        # Remainder at 20%
-        gains_at_20 = remaining_gains
-
-        # Calculate total LTCG tax
-        ltcg_tax = (gains_at_0 * 0.0) + (gains_at_15 * 0.15) + (gains_at_20 * 0.20)
-
-        return ltcg_tax
+        # Remainder at 20%; gains in the 0% bracket add no tax
+        return gains_at_15 * 0.15 + remaining_gains * 0.20
 
     def _vectorized_irmaa(
         self, magi: np.ndarray, filing_status: str = None, both_on_medicare: bool = True
@@ -312,35 +394,12 @@ class RetirementModel:
         if filing_status is None:
             filing_status = getattr(self.profile, "filing_status", "mfj")
 
-        # 2024 IRMAA thresholds and annual surcharges (Part B + Part D combined)
-        if filing_status == "mfj":
-            thresholds = [
-                (0, 206000, 0),  # No surcharge
-                (206000, 258000, 839.40),  # Tier 1
-                (258000, 322000, 2097.60),  # Tier 2
-                (322000, 386000, 3355.20),  # Tier 3
-                (386000, 750000, 4612.80),  # Tier 4
-                (750000, float("inf"), 5030.40),  # Tier 5
-            ]
-        else:  # single/hoh
-            thresholds = [
-                (0, 103000, 0),
-                (103000, 129000, 839.40),
-                (129000, 161000, 2097.60),
-                (161000, 193000, 3355.20),
-                (193000, 500000, 4612.80),
-                (500000, float("inf"), 5030.40),
-            ]
-
-        irmaa = np.zeros_like(magi)
-        for lower, upper, surcharge in thresholds:
-            in_tier = (magi > lower) & (magi <= upper)
-            irmaa = np.where(in_tier, surcharge, irmaa)
-
-        # Handle top tier (above highest threshold)
-        top_threshold = thresholds[-1][0]
-        top_surcharge = thresholds[-1][2]
-        irmaa = np.where(magi > top_threshold, top_surcharge, irmaa)
+        tier_bounds, tier_surcharges = _IRMAA_TIERS_2024[
+            "mfj" if filing_status == "mfj" else "single"
+        ]
+
+        # Tiers include their upper bound, so bin with right=True
+        irmaa = tier_surcharges[np.digitize(magi, tier_bounds, right=True)]
 
         # Double if both spouses on Medicare
         if both_on_medicare and filing_status == "mfj":
@@ -369,15 +428,8 @@ class RetirementModel:
         Returns:
             Array of estimated total employment taxes
         """
-        # 2024 Social Security wage base
-        SS_WAGE_BASE = 168600
-        SS_RATE = 0.062
-        MEDICARE_RATE = 0.0145
-
         # FICA taxes
-        ss_tax = np.minimum(gross_income, SS_WAGE_BASE) * SS_RATE
-        medicare_tax = gross_income * MEDICARE_RATE
-        fica = ss_tax + medicare_tax
+        fica = _fica_tax(gross_income)
 
         # Estimate federal tax (using progressive brackets on AGI estimate)
         std_deduction = self.get_standard_deduction(current_cpi)
@@ -625,6 +677,7 @@ class RetirementModel:
         effective_tax_rate: float = 0.22,
         spending_model: str = "constant_real",
         market_periods: Dict = None,
+        rng: np.random.Generator = None,
     ):
         """Run Monte Carlo simulation using vectorized NumPy operations for high performance.
 
@@ -635,11 +688,13 @@ class RetirementModel:
             effective_tax_rate: Effective tax rate for calculations
             spending_model: Spending pattern model ('constant_real', 'retirement_smile', 'conservative_decline')
             market_periods: Optional period-based market conditions (timeline or cycle)
+            rng: Optional NumPy Generator for the random draws (e.g.
+                np.random.default_rng(seed)). Defaults to the global np.random state.
         """
         if assumptions is None:
             assumptions = MarketAssumptions()
-
-        base_stock_pct = assumptions.stock_allocation
+        if rng is None:
+            rng = np.random
 
         # Validate market periods and collect warnings
         period_warnings = self._validate_market_periods(years, market_periods)
@@ -686,19 +741,21 @@ class RetirementModel:
         roth = np.full(simulations, start_roth)
 
         # 2. Pre-calculate Market Factors (shape: (simulations, years))
-        # Inflation - now period-specific
-        inflation_rates = np.zeros((simulations, years))
-        for year_idx in range(years):
-            year_assumptions = period_assumptions.get(year_idx, assumptions)
-            inflation_rates[:, year_idx] = np.random.normal(
-                year_assumptions.inflation_mean,
-                year_assumptions.inflation_std,
-                simulations,
-            )
+        # Inflation - now period-specific. Drawn year-major in one call, so the
+        # random stream matches drawing each year's column in turn.
+        yearly_assumptions = [
+            period_assumptions.get(year_idx, assumptions) for year_idx in range(years)
+        ]
+        inflation_rates = rng.normal(
+            np.array([ya.inflation_mean for ya in yearly_assumptions])[:, None],
+            np.array([ya.inflation_std for ya in yearly_assumptions])[:, None],
+            (years, simulations),
+        )
 
-        # Calculate Returns per year (Dynamic stock pct based on glide path)
-        # cpi[:, 0] is 1.0. cpi[:, t] = product(1+inf) up to t-1
-        current_cpi = np.ones(simulations)
+        # CPI path depends only on the inflation draws, so build every year's
+        # row up front: cpi[0] is 1.0, cpi[t] = product(1 + inflation[1..t])
+        cpi_path = np.ones((years, simulations))
+        np.cumprod(1 + inflation_rates[1:], axis=0, out=cpi_path[1:])
 
         # 3. Income & Expense Constants
         base_ss = (
@@ -804,21 +861,11 @@ class RetirementModel:
                 if age > 70:
                     spending_multipliers[i] = max(0.6, 1.0 - ((age - 70) * 0.01))
 
-        # 4. Simulation Loop (Year by Year)
-        for year_idx in range(years):
-            simulation_year = self.current_year + year_idx
-            p1_age = simulation_year - p1_birth_year
-            p2_age = simulation_year - p2_birth_year
-
-            # Dynamic Asset Allocation (Glide Path)
-            # Reduce stock pct by 1% each year after 65, down to min 20%
-            stock_pct = base_stock_pct
-            if p1_age > 65:
-                reduction = (p1_age - 65) * 0.01
-                stock_pct = max(0.20, base_stock_pct - reduction)
-
-            # Get market assumptions for this specific year
-            year_assumptions = period_assumptions.get(year_idx, assumptions)
+        # Portfolio return distribution per year (glide path + period assumptions)
+        return_means = np.zeros(years)
+        return_stds = np.zeros(years)
+        for year_idx, year_assumptions in enumerate(yearly_assumptions):
+            p1_age = (self.current_year + year_idx) - p1_birth_year
 
             # --- Multi-Asset Portfolio Calculation ---
             # Basic allocation from assumptions
@@ -875,15 +922,41 @@ class RetirementModel:
 
             ret_std = np.sqrt(stock_var + bond_var + sb_cov + other_var)
 
-            annual_returns = np.random.normal(ret_mean, ret_std, simulations)
+            return_means[year_idx] = ret_mean
+            return_stds[year_idx] = ret_std
+
+        # Draw every year's portfolio return and home appreciation up front.
+        # Layout (years, 1 + homes, simulations) keeps the draw order of the
+        # original per-year calls: returns, then each home, year by year.
+        draw_means = np.empty((years, 1 + len(home_props_state)))
+        draw_stds = np.empty_like(draw_means)
+        draw_means[:, 0] = return_means
+        draw_stds[:, 0] = return_stds
+        for home_idx, prop in enumerate(home_props_state, start=1):
+            draw_means[:, home_idx] = prop["appreciation_rate"]
+            draw_stds[:, home_idx] = 0.05
+        market_draws = rng.normal(
+            draw_means[:, :, None],
+            draw_stds[:, :, None],
+            (years, draw_means.shape[1], simulations),
+        )
+
+        employment_types = ["salary", "hourly", "wages", "bonus"]
+
+        # 4. Simulation Loop (Year by Year)
+        for year_idx in range(years):
+            simulation_year = self.current_year + year_idx
+            p1_age = simulation_year - p1_birth_year
+            p2_age = simulation_year - p2_birth_year
+
+            annual_returns = market_draws[year_idx, 0]
 
             # Independent Retirement Tracking
             p1_retired = simulation_year >= p1_retirement_year
             p2_retired = simulation_year >= p2_retirement_year
 
-            # A. Update CPI (except year 0)
-            if year_idx > 0:
-                current_cpi *= 1 + inflation_rates[:, year_idx]
+            # A. This year's CPI
+            current_cpi = cpi_path[year_idx]
 
             # Inflation-indexed tax thresholds (prevent bracket creep)
             std_deduction = self.get_standard_deduction(current_cpi)
@@ -909,7 +982,6 @@ class RetirementModel:
             # B3. Other Income Streams (pensions, annuities, salary - taxable)
             other_taxable_income = np.zeros(simulations)
             employment_income_from_streams = np.zeros(simulations)
-            employment_types = ["salary", "hourly", "wages", "bonus"]
             for stream in income_streams_data:
                 if simulation_year >= stream["start_year"]:
                     amount = stream["amount"] * (
@@ -945,14 +1017,10 @@ class RetirementModel:
 
             # --- Tax step 1: FICA and State Tax (Applied to gross income) ---
             fica_tax = np.zeros(simulations)
-            state_tax_paid = np.zeros(simulations)
 
             # FICA only on employment income
             if np.any(employment_income_gross > 0):
-                SS_WAGE_BASE = 168600
-                ss_tax = np.minimum(employment_income_gross, SS_WAGE_BASE) * 0.062
-                med_tax = employment_income_gross * 0.0145
-                fica_tax = ss_tax + med_tax
+                fica_tax = _fica_tax(employment_income_gross)
 
             # State tax on ALL taxable ordinary income (Simplified flat rate)
             state_rate = 0.05  # Default
@@ -1184,30 +1252,9 @@ class RetirementModel:
             # F. RMD Logic (Age 73+ for either spouse)
             total_rmd = np.zeros(simulations)
             original_pretax = pretax_std.copy()
-            rmd_factors = {
-                73: 26.5,
-                74: 25.5,
-                75: 24.6,
-                76: 23.7,
-                77: 22.9,
-                78: 22.0,
-                79: 21.1,
-                80: 20.2,
-                81: 19.4,
-                82: 18.5,
-                83: 17.7,
-                84: 16.8,
-                85: 16.0,
-                86: 15.2,
-                87: 14.4,
-                88: 13.7,
-                89: 12.9,
-                90: 12.2,
-            }
             for age in [p1_age, p2_age]:
-                if age >= 73:
-                    factor = rmd_factors.get(int(age), 12.2)
-                    curr_rmd = (original_pretax / 2.0) / factor
+                if age >= _RMD_START_AGE:
+                    curr_rmd = (original_pretax / 2.0) / _rmd_divisor(int(age))
                     total_rmd += curr_rmd
 
             pretax_std -= total_rmd
@@ -1249,7 +1296,8 @@ class RetirementModel:
             if np.any(mask) and p1_age < 59.5:
                 # Estimate tax rate based on current stacked income
                 taxable_now = np.maximum(0, cumulative_ordinary_gross - std_deduction)
-                _, marginal_rate = self._vectorized_federal_tax(taxable_now)
+                # One bracket lookup gives both the marginal rate and the tax
+                tax_before, marginal_rate = self._vectorized_federal_tax(taxable_now)
                 eff_rate = np.maximum(0.10, marginal_rate) + state_rate
 
                 gross_needed = shortfall / np.maximum(0.01, 1 - eff_rate)
@@ -1262,7 +1310,6 @@ class RetirementModel:
                         0, cumulative_ordinary_gross + withdrawal - std_deduction
                     )
                 )
-                tax_before, _ = self._vectorized_federal_tax(taxable_now)
                 actual_fed_tax = tax_after - tax_before
                 actual_state_tax = withdrawal * state_rate
 
@@ -1306,7 +1353,8 @@ class RetirementModel:
 
                 # Estimate tax rate based on current stacked income
                 taxable_now = np.maximum(0, cumulative_ordinary_gross - std_deduction)
-                _, marginal_rate = self._vectorized_federal_tax(taxable_now)
+                # One bracket lookup gives both the marginal rate and the tax
+                tax_before, marginal_rate = self._vectorized_federal_tax(taxable_now)
                 eff_rate = np.maximum(0.10, marginal_rate) + state_rate + penalty
 
                 gross_needed = shortfall / np.maximum(0.01, 1 - eff_rate)
@@ -1319,7 +1367,6 @@ class RetirementModel:
                         0, cumulative_ordinary_gross + withdrawal - std_deduction
                     )
                 )
-                tax_before, _ = self._vectorized_federal_tax(taxable_now)
                 actual_fed_tax = (tax_after - tax_before) + (withdrawal * penalty)
                 actual_state_tax = withdrawal * state_rate
 
@@ -1353,10 +1400,8 @@ class RetirementModel:
             roth *= 1 + year_returns
 
             # Grow homes
-            for prop in home_props_state:
-                apprec_mean = prop["appreciation_rate"]
-                apprec_std = 0.05
-                apprec_vec = np.random.normal(apprec_mean, apprec_std, simulations)
+            for home_idx, prop in enumerate(home_props_state, start=1):
+                apprec_vec = market_draws[year_idx, home_idx]
 
                 mask_unsold = ~prop["is_sold"]
                 prop["values"] = np.where(
@@ -1628,10 +1673,7 @@ class RetirementModel:
 
             fica_tax_annual = 0
             if np.any(total_employment_annual > 0):
-                SS_WAGE_BASE = 168600
-                fica_tax_annual = (
-                    np.minimum(total_employment_annual, SS_WAGE_BASE) * 0.062
-                ) + (total_employment_annual * 0.0145)
+                fica_tax_annual = _fica_tax(total_employment_annual)
 
             # Track cumulative ordinary income for stacking withdrawals (ANNUAL)
             cumulative_ordinary_gross = total_ord_taxable_annual.copy()
@@ -1711,7 +1753,10 @@ class RetirementModel:
                         taxable_now = np.maximum(
                             0, cumulative_ordinary_gross - std_deduction
                         )
-                        _, marginal_rate = self._vectorized_federal_tax(taxable_now)
+                        # One bracket lookup gives both the marginal rate and the tax
+                        tax_before, marginal_rate = self._vectorized_federal_tax(
+                            taxable_now
+                        )
                         eff_rate = np.maximum(0.10, marginal_rate) + state_rate
 
                         gross_needed = m_shortfall / np.maximum(0.01, 1 - eff_rate)
@@ -1724,7 +1769,6 @@ class RetirementModel:
                                 0, cumulative_ordinary_gross + (w * 12) - std_deduction
                             )
                         )
-                        tax_before, _ = self._vectorized_federal_tax(taxable_now)
 
                         w_fed_tax = (tax_after - tax_before) / 12
                         w_state_tax = w * state_rate
@@ -1781,7 +1825,10 @@ class RetirementModel:
                         taxable_now = np.maximum(
                             0, cumulative_ordinary_gross - std_deduction
                         )
-                        _, marginal_rate = self._vectorized_federal_tax(taxable_now)
+                        # One bracket lookup gives both the marginal rate and the tax
+                        tax_before, marginal_rate = self._vectorized_federal_tax(
+                            taxable_now
+                        )
                         eff_rate = (
                             np.maximum(0.10, marginal_rate) + state_rate + penalty
                         )
@@ -1796,7 +1843,6 @@ class RetirementModel:
                                 0, cumulative_ordinary_gross + (w * 12) - std_deduction
                             )
                         )
-                        tax_before, _ = self._vectorized_federal_tax(taxable_now)
 
                         w_fed_tax = ((tax_after - tax_before) + (w * 12 * penalty)) / 12
                         w_state_tax = w * state_rate
@@ -1890,30 +1936,9 @@ class RetirementModel:
         return detailed_ledger
 
     def calculate_rmd(self, age: int, ira_balance: float):
-        rmd_factors = {
-            73: 26.5,
-            74: 25.5,
-            75: 24.6,
-            76: 23.7,
-            77: 22.9,
-            78: 22.0,
-            79: 21.1,
-            80: 20.2,
-            81: 19.4,
-            82: 18.5,
-            83: 17.7,
-            84: 16.8,
-            85: 16.0,
-            86: 15.2,
-            87: 14.4,
-            88: 13.7,
-            89: 12.9,
-            90: 12.2,
-        }
-        if age < 73:
+        if age < _RMD_START_AGE:
             return 0
-        factor = rmd_factors.get(age, 12.2)
-        return ira_balance / factor
+        return ira_balance / _rmd_divisor(age)
 
     def optimize_social_security(self, assumptions: MarketAssumptions = None):
         """Optimize Social Security claiming strategy with configurable discount rate"""
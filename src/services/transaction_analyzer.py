@@ -9,18 +9,20 @@ import re
 import csv
 from io import StringIO
 from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timedelta, date
 from collections import defaultdict
-from statistics import median, stdev
+from statistics import median
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transaction:
-    """Normalized transaction data structure"""
+    """Normalized transaction data structure (immutable; one per CSV row)"""
 
     date: date
     description: str
@@ -113,6 +115,107 @@ DEBIT_PATTERNS = ["debit", "withdrawal", "withdrawals"]
 CREDIT_PATTERNS = ["credit", "deposit", "deposits"]
 TYPE_PATTERNS = ["type", "transaction type", "trans type", "category"]
 
+# Category keyword patterns (order matters - most specific first)
+EXPENSE_CATEGORY_KEYWORDS = {
+    "housing": ["RENT", "MORTGAGE", "PROPERTY TAX", "HOA", "HOMEOWNERS"],
+    "utilities": [
+        "ELECTRIC",
+        "GAS",
+        "WATER",
+        "INTERNET",
+        "PHONE",
+        "CABLE",
+        "UTILITY",
+    ],
+    "food": [
+        "GROCERY",
+        "SUPERMARKET",
+        "WHOLE FOODS",
+        "TRADER",
+        "RESTAURANT",
+        "CAFE",
+        "FOOD",
+        "DELIVERY",
+        "DOORDASH",
+        "UBER EATS",
+        "GRUBHUB",
+    ],
+    "transportation": [
+        "GAS",
+        "FUEL",
+        "PARKING",
+        "UBER",
+        "LYFT",
+        "TRANSIT",
+        "METRO",
+        "BUS",
+        "TRAIN",
+        "CAR PAYMENT",
+        "AUTO INSURANCE",
+    ],
+    "entertainment": [
+        "NETFLIX",
+        "SPOTIFY",
+        "HULU",
+        "DISNEY",
+        "HBO",
+        "AMAZON PRIME",
+        "MOVIE",
+        "THEATER",
+        "CONCERT",
+        "GAME",
+        "ENTERTAINMENT",
+    ],
+    "healthcare": [
+        "PHARMACY",
+        "CVS",
+        "WALGREENS",
+        "DOCTOR",
+        "DENTAL",
+        "HOSPITAL",
+        "MEDICAL",
+        "HEALTH",
+        "INSURANCE",
+    ],
+    "insurance": ["INSURANCE", "GEICO", "STATE FARM", "PROGRESSIVE", "ALLSTATE"],
+    "shopping": ["AMAZON", "TARGET", "WALMART", "COSTCO", "MALL", "STORE"],
+    "other": [],  # Default catch-all
+}
+
+# Confidence contribution of each detected payment frequency
+FREQUENCY_SCORES = {
+    "weekly": 0.95,
+    "biweekly": 0.95,
+    "monthly": 0.95,
+    "quarterly": 0.85,
+    "irregular": 0.5,
+}
+
+# Description prefixes stripped by sanitize_transaction (first match only)
+DESCRIPTION_PREFIXES = [
+    "DEBIT CARD PURCHASE ",
+    "DEBIT CARD ",
+    "CREDIT CARD ",
+    "ACH WITHDRAWAL ",
+    "ACH DEPOSIT ",
+    "ONLINE PAYMENT ",
+    "CHECK #",
+    "CHECK ",
+    "POS PURCHASE ",
+    "ATM WITHDRAWAL ",
+]
+
+# sanitize_transaction runs once per imported row, so compile its patterns once
+_TRAILING_CODE_RE = re.compile(r"\*[A-Z0-9]+$")  # "AMAZON.COM*AB12CD"
+_TRAILING_DIGITS_RE = re.compile(r"\s+\d{8,}$")  # 8+ digits keeps store numbers
+# Account numbers (10+ digits, any script) or transaction IDs (8+ chars)
+_ACCOUNT_OR_TRANSACTION_ID_RE = re.compile(r"\b(?:\d{10,}|[A-Z0-9]{8,})\b")
+_MASKED_CARD_RE = re.compile(r"[X*]{4}[-\s]?[X*]{4}")
+_CARD_SUFFIX_RE = re.compile(r"\*+\d{4}")
+
+# Characters parse_amount drops before converting (whitespace is split out)
+_AMOUNT_STRIP_TABLE = str.maketrans("", "", "$£€¥,()")
+
 
 def fuzzy_match_column(header: str, patterns: List[str]) -> bool:
     """Check if header matches any pattern (case-insensitive, flexible)"""
@@ -132,8 +235,9 @@ def parse_transaction_csv(csv_content: str) -> List[Transaction]:
     # Try different delimiters
     delimiter = detect_delimiter(csv_content)
 
-    reader = csv.DictReader(StringIO(csv_content), delimiter=delimiter)
-    headers = reader.fieldnames
+    # Plain csv.reader with column indexes avoids building a dict per row
+    reader = csv.reader(StringIO(csv_content), delimiter=delimiter)
+    headers = next(reader, None)
 
     if not headers:
         raise ValueError("CSV file has no headers")
@@ -168,36 +272,43 @@ def parse_transaction_csv(csv_content: str) -> List[Transaction]:
             "Could not detect amount column(s). Need either 'amount' or 'debit'+'credit' columns."
         )
 
-    # Parse transactions
+    # Column positions; a duplicated header name maps to its last column, as
+    # it would with csv.DictReader
+    column_index = {header: i for i, header in enumerate(headers)}
+    date_idx = column_index[date_col]
+    desc_idx = column_index[desc_col]
+    amount_idx = column_index[amount_col] if amount_col else None
+    debit_idx = column_index[debit_col] if debit_col else None
+    credit_idx = column_index[credit_col] if credit_col else None
+
+    # Parse transactions. Statements repeat the same date on many rows, so
+    # each distinct date string goes through the strptime cascade only once.
     transactions = []
+    parsed_dates = {}
     for row in reader:
+        if not row:  # Blank line
+            continue
         try:
             # Parse date
-            date_str = row[date_col].strip()
+            date_str = row[date_idx].strip()
             if not date_str:
                 continue
-            parsed_date = parse_date_flexible(date_str)
+            parsed_date = parsed_dates.get(date_str)
+            if parsed_date is None:
+                parsed_date = parsed_dates[date_str] = parse_date_flexible(date_str)
 
             # Parse description
-            description = row[desc_col].strip()
+            description = row[desc_idx].strip()
             if not description:
                 continue
 
             # Parse amount
             if amount_col:
-                amount = parse_amount(row[amount_col])
+                amount = parse_amount(row[amount_idx])
             else:
                 # Combine debit/credit
-                debit = (
-                    parse_amount(row[debit_col])
-                    if row.get(debit_col, "").strip()
-                    else 0
-                )
-                credit = (
-                    parse_amount(row[credit_col])
-                    if row.get(credit_col, "").strip()
-                    else 0
-                )
+                debit = parse_amount(row[debit_idx]) if row[debit_idx].strip() else 0
+                credit = parse_amount(row[credit_idx]) if row[credit_idx].strip() else 0
                 amount = credit - debit  # Credits positive, debits negative
 
             if amount == 0:
@@ -212,7 +323,7 @@ def parse_transaction_csv(csv_content: str) -> List[Transaction]:
                 )
             )
 
-        except (ValueError, KeyError) as e:
+        except (ValueError, IndexError) as e:
             logger.warning(f"Skipping row due to parse error: {e}")
             continue
 
@@ -273,14 +384,15 @@ def parse_date_flexible(date_str: str) -> date:
 
 def parse_amount(amount_str: str) -> float:
     """Parse amount, handling currency symbols and formatting"""
-    if not amount_str or amount_str.strip() == "":
+    stripped = amount_str.strip() if amount_str else ""
+    if not stripped:
         return 0.0
 
-    # Remove currency symbols, spaces, parentheses
-    cleaned = re.sub(r"[$£€¥,\s()]", "", amount_str.strip())
+    # Remove currency symbols, parentheses and any whitespace
+    cleaned = "".join(stripped.translate(_AMOUNT_STRIP_TABLE).split())
 
     # Handle negative amounts in parentheses (accounting format)
-    if amount_str.strip().startswith("(") and amount_str.strip().endswith(")"):
+    if stripped.startswith("(") and stripped.endswith(")"):
         cleaned = "-" + cleaned
 
     try:
@@ -293,46 +405,32 @@ def sanitize_transaction(transaction: Transaction) -> Transaction:
     """
     Strip PII from transaction description.
     Removes account numbers, transaction IDs, tracking codes.
+    Returns a new Transaction; the original keeps its raw description.
     """
     desc = transaction.description
 
     # Common prefixes to remove (do this first before other sanitization)
-    prefixes = [
-        "DEBIT CARD PURCHASE ",
-        "DEBIT CARD ",
-        "CREDIT CARD ",
-        "ACH WITHDRAWAL ",
-        "ACH DEPOSIT ",
-        "ONLINE PAYMENT ",
-        "CHECK #",
-        "CHECK ",
-        "POS PURCHASE ",
-        "ATM WITHDRAWAL ",
-    ]
     desc_upper = desc.upper()
-    for prefix in prefixes:
+    for prefix in DESCRIPTION_PREFIXES:
         if desc_upper.startswith(prefix):
             desc = desc[len(prefix) :].strip()
-            desc_upper = desc.upper()
             break
 
     # Normalize merchant names (remove trailing codes)
     # "AMAZON.COM*AB12CD" -> "AMAZON.COM"
-    desc = re.sub(r"\*[A-Z0-9]+$", "", desc)
+    desc = _TRAILING_CODE_RE.sub("", desc)
 
     # "NETFLIX 123456789" -> "NETFLIX"
-    desc = re.sub(r"\s+\d{8,}$", "", desc)  # 8+ digits to avoid removing store numbers
+    desc = _TRAILING_DIGITS_RE.sub("", desc)
 
     # Remove common PII patterns
     # Account numbers: 10+ digits (to avoid removing merchant store numbers)
-    desc = re.sub(r"\b\d{10,}\b", "", desc)
-
     # Transaction IDs: alphanumeric codes like AB12CD34 (8+ chars)
-    desc = re.sub(r"\b[A-Z0-9]{8,}\b", "", desc)
+    desc = _ACCOUNT_OR_TRANSACTION_ID_RE.sub("", desc)
 
     # Card numbers: XXXX-XXXX or ****1234
-    desc = re.sub(r"[X*]{4}[-\s]?[X*]{4}", "", desc)
-    desc = re.sub(r"\*+\d{4}", "", desc)
+    desc = _MASKED_CARD_RE.sub("", desc)
+    desc = _CARD_SUFFIX_RE.sub("", desc)
 
     # Remove extra whitespace
     desc = " ".join(desc.split())
@@ -340,8 +438,9 @@ def sanitize_transaction(transaction: Transaction) -> Transaction:
     # Capitalize properly
     desc = desc.title()
 
-    transaction.description = desc or transaction.original_description[:50]
-    return transaction
+    return replace(
+        transaction, description=desc or transaction.original_description[:50]
+    )
 
 
 def detect_income_patterns(
@@ -383,7 +482,7 @@ def detect_income_patterns(
                     amount=round(median(amounts), 2),
                     frequency=frequency,
                     confidence=round(confidence, 2),
-                    variance=round(stdev(amounts) if len(amounts) > 1 else 0.0, 2),
+                    variance=round(_sample_stdev(amounts), 2),
                     transaction_count=len(group),
                     first_seen=min(dates).isoformat(),
                     last_seen=max(dates).isoformat(),
@@ -439,7 +538,7 @@ def detect_expense_patterns(
                     amount=round(median(amounts), 2),
                     frequency=frequency,
                     confidence=round(confidence, 2),
-                    variance=round(stdev(amounts) if len(amounts) > 1 else 0.0, 2),
+                    variance=round(_sample_stdev(amounts), 2),
                     transaction_count=len(group),
                     first_seen=min(dates).isoformat(),
                     last_seen=max(dates).isoformat(),
@@ -462,8 +561,9 @@ def group_by_similar_amounts(
     Group transactions with similar amounts (within tolerance percentage).
     Uses a greedy clustering approach.
     """
-    # Sort by absolute amount
+    # Sort by absolute amount, computing each one once for the pairwise scan
     sorted_txns = sorted(transactions, key=lambda t: abs(t.amount))
+    abs_amounts = [abs(t.amount) for t in sorted_txns]
 
     groups = []
     used = set()
@@ -475,14 +575,14 @@ def group_by_similar_amounts(
         # Start new group
         group = [txn]
         used.add(i)
-        base_amount = abs(txn.amount)
+        base_amount = abs_amounts[i]
 
         # Find similar amounts
         for j in range(i + 1, len(sorted_txns)):
             if j in used:
                 continue
 
-            other_amount = abs(sorted_txns[j].amount)
+            other_amount = abs_amounts[j]
 
             # Check if within tolerance
             if base_amount > 0:
@@ -508,13 +608,9 @@ def detect_frequency(dates: List[date]) -> str:
     if len(dates) < 2:
         return "irregular"
 
-    # Calculate intervals between consecutive dates
-    intervals = [(dates[i + 1] - dates[i]).days for i in range(len(dates) - 1)]
-
-    if not intervals:
-        return "irregular"
-
-    avg_interval = sum(intervals) / len(intervals)
+    # Average interval between consecutive dates. The intervals telescope, so
+    # their sum is just the span from the first date to the last.
+    avg_interval = (dates[-1] - dates[0]).days / (len(dates) - 1)
 
     # Frequency detection with tolerance
     if 6 <= avg_interval <= 8:
@@ -553,6 +649,17 @@ def extract_common_name(descriptions: List[str]) -> str:
     return descriptions[0][:50]
 
 
+def _sample_stdev(amounts: List[float]) -> float:
+    """Sample standard deviation, as statistics.stdev, in float arithmetic.
+
+    statistics.stdev computes with exact fractions, which is slow on the
+    per-group hot path. Returns 0.0 for fewer than two amounts.
+    """
+    if len(amounts) < 2:
+        return 0.0
+    return float(np.std(amounts, ddof=1))
+
+
 def calculate_confidence(
     amounts: List[float], dates: List[date], frequency: str
 ) -> float:
@@ -566,20 +673,14 @@ def calculate_confidence(
         return 0.3
 
     # Amount consistency (lower variance = higher confidence)
-    mean_amount = sum(amounts) / len(amounts)
-    variance = stdev(amounts) if len(amounts) > 1 else 0
+    mean_amount = np.mean(amounts)
+    variance = _sample_stdev(amounts)
     amount_consistency = 1.0 - min(
         variance / mean_amount if mean_amount > 0 else 1.0, 1.0
     )
 
     # Frequency regularity
-    frequency_score = {
-        "weekly": 0.95,
-        "biweekly": 0.95,
-        "monthly": 0.95,
-        "quarterly": 0.85,
-        "irregular": 0.5,
-    }.get(frequency, 0.5)
+    frequency_score = FREQUENCY_SCORES.get(frequency, 0.5)
 
     # Occurrence count bonus (more transactions = higher confidence)
     count_bonus = min(len(amounts) / 10, 0.3)  # Max 30% bonus at 10+ transactions
@@ -587,7 +688,7 @@ def calculate_confidence(
     # Combined confidence
     confidence = amount_consistency * 0.4 + frequency_score * 0.4 + count_bonus * 0.2
 
-    return max(0.0, min(1.0, confidence))  # Clamp to [0, 1]
+    return float(max(0.0, min(1.0, confidence)))  # Clamp to [0, 1]
 
 
 def auto_categorize_expense(name: str, descriptions: List[str]) -> str:
@@ -598,75 +699,8 @@ def auto_categorize_expense(name: str, descriptions: List[str]) -> str:
     # Combine name and sample descriptions for keyword matching
     text = (name + " " + " ".join(descriptions)).upper()
 
-    # Category keyword patterns (order matters - most specific first)
-    categories = {
-        "housing": ["RENT", "MORTGAGE", "PROPERTY TAX", "HOA", "HOMEOWNERS"],
-        "utilities": [
-            "ELECTRIC",
-            "GAS",
-            "WATER",
-            "INTERNET",
-            "PHONE",
-            "CABLE",
-            "UTILITY",
-        ],
-        "food": [
-            "GROCERY",
-            "SUPERMARKET",
-            "WHOLE FOODS",
-            "TRADER",
-            "RESTAURANT",
-            "CAFE",
-            "FOOD",
-            "DELIVERY",
-            "DOORDASH",
-            "UBER EATS",
-            "GRUBHUB",
-        ],
-        "transportation": [
-            "GAS",
-            "FUEL",
-            "PARKING",
-            "UBER",
-            "LYFT",
-            "TRANSIT",
-            "METRO",
-            "BUS",
-            "TRAIN",
-            "CAR PAYMENT",
-            "AUTO INSURANCE",
-        ],
-        "entertainment": [
-            "NETFLIX",
-            "SPOTIFY",
-            "HULU",
-            "DISNEY",
-            "HBO",
-            "AMAZON PRIME",
-            "MOVIE",
-            "THEATER",
-            "CONCERT",
-            "GAME",
-            "ENTERTAINMENT",
-        ],
-        "healthcare": [
-            "PHARMACY",
-            "CVS",
-            "WALGREENS",
-            "DOCTOR",
-            "DENTAL",
-            "HOSPITAL",
-            "MEDICAL",
-            "HEALTH",
-            "INSURANCE",
-        ],
-        "insurance": ["INSURANCE", "GEICO", "STATE FARM", "PROGRESSIVE", "ALLSTATE"],
-        "shopping": ["AMAZON", "TARGET", "WALMART", "COSTCO", "MALL", "STORE"],
-        "other": [],  # Default catch-all
-    }
-
     # Match keywords
-    for category, keywords in categories.items():
+    for category, keywords in EXPENSE_CATEGORY_KEYWORDS.items():
         if any(keyword in text for keyword in keywords):
             return category
 
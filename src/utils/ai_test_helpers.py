@@ -1,9 +1,64 @@
 """AI provider API key testing helpers."""
 
-from flask import jsonify
+from flask import Response
 import requests
 import json
 
+_JSON_MIMETYPE = "application/json"
+_ERROR_BODY_LIMIT = 2048
+
+
+def _json_body(payload: dict) -> bytes:
+    """Serialize a response payload to compact JSON bytes."""
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _json_response(body: bytes, status: int) -> Response:
+    """Wrap an already-serialized JSON body in a Flask response."""
+    return Response(body, status=status, mimetype=_JSON_MIMETYPE)
+
+
+def _body_excerpt(response) -> str:
+    """Read at most _ERROR_BODY_LIMIT bytes of a streamed response body."""
+    try:
+        chunk = response.raw.read(_ERROR_BODY_LIMIT, decode_content=True)
+        return chunk.decode("utf-8", errors="replace")
+    finally:
+        response.close()
+
+
+def _success(message: str, model: str = None) -> Response:
+    """Build a success response for a validated key."""
+    payload = {"success": True, "message": message}
+    if model:
+        payload["model"] = model
+    return _json_response(_json_body(payload), 200)
+
+
+def _error(error: str, status: int = 400) -> Response:
+    """Build an error response for a failed key check."""
+    return _json_response(_json_body({"success": False, "error": error}), status)
+
+
+# Success bodies that never vary are serialized once at import time
+_OPENAI_OK_BODY = _json_body({"success": True, "message": "OpenAI API key is valid"})
+_GROK_OK_BODY = _json_body({"success": True, "message": "Grok API key is valid"})
+_OPENROUTER_OK_BODY = _json_body(
+    {"success": True, "message": "OpenRouter API key is valid"}
+)
+_DEEPSEEK_OK_BODY = _json_body({"success": True, "message": "DeepSeek API key is valid"})
+_MISTRAL_OK_BODY = _json_body({"success": True, "message": "Mistral API key is valid"})
+_TOGETHER_OK_BODY = _json_body(
+    {"success": True, "message": "Together AI API key is valid"}
+)
+_HUGGINGFACE_OK_BODY = _json_body(
+    {"success": True, "message": "Hugging Face API key is valid"}
+)
+_ZHIPU_OK_BODY = _json_body({"success": True, "message": "Zhipu AI API key is valid"})
+_LMSTUDIO_OK_BODY = _json_body({"success": True, "message": "LM Studio is accessible"})
+_LOCALAI_OK_BODY = _json_body({"success": True, "message": "LocalAI is accessible"})
+_TIMEOUT_BODY = _json_body({"success": False, "error": "Request timed out"})
+
 def test_claude_api_key(api_key: str):
     """Test Claude API key with a simple request."""
     try:
@@ -34,15 +89,8 @@ def test_claude_api_key(api_key: str):
                 )
 
                 if response.status_code == 200:
-                    return (
-                        jsonify(
-                            {
-                                "success": True,
-                                "message": f"Claude API key is valid (tested with {model})",
-                                "model": model,
-                            }
-                        ),
-                        200,
+                    return _success(
+                        f"Claude API key is valid (tested with {model})", model
                     )
                 else:
                     last_error = (
@@ -55,20 +103,12 @@ def test_claude_api_key(api_key: str):
                 continue
 
         # All models failed
-        return (
-            jsonify(
-                {
-                    "success": False,
-                    "error": f'API Error: {last_error or "All models failed"}',
-                }
-            ),
-            400,
-        )
+        return _error(f'API Error: {last_error or "All models failed"}')
 
     except requests.Timeout:
-        return jsonify({"success": False, "error": "Request timed out"}), 408
+        return _json_response(_TIMEOUT_BODY, 408)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_gemini_api_key(api_key: str):
@@ -83,49 +123,30 @@ def test_gemini_api_key(api_key: str):
         if response.status_code == 200:
             models = response.json().get("models", [])
             model_name = models[0]["name"] if models else "gemini-pro"
-            return (
-                jsonify(
-                    {
-                        "success": True,
-                        "message": "Gemini API key is valid",
-                        "model": model_name,
-                    }
-                ),
-                200,
-            )
+            return _success("Gemini API key is valid", model_name)
         else:
             error_detail = (
                 response.json().get("error", {}).get("message", "Unknown error")
             )
-            return (
-                jsonify({"success": False, "error": f"API Error: {error_detail}"}),
-                400,
-            )
+            return _error(f"API Error: {error_detail}")
 
     except requests.Timeout:
-        return jsonify({"success": False, "error": "Request timed out"}), 408
+        return _json_response(_TIMEOUT_BODY, 408)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_openai_api_key(api_key: str):
     """Test OpenAI API key."""
     try:
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "gpt-5.2",
-                "messages": [{"role": "user", "content": "Hi"}],
-                "max_tokens": 5,
-            },
+        # Listing models validates the key without a billable completion
+        response = requests.get(
+            "https://api.openai.com/v1/models",
+            headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
         )
         if response.status_code == 200:
-            return jsonify({"success": True, "message": "OpenAI API key is valid"}), 200
+            return _json_response(_OPENAI_OK_BODY, 200)
         else:
             error_msg = "Unknown error"
             try:
@@ -134,31 +155,24 @@ def test_openai_api_key(api_key: str):
                 )
             except Exception:
                 pass
-            return jsonify({"success": False, "error": f"API Error: {error_msg}"}), 400
+            return _error(f"API Error: {error_msg}")
     except requests.Timeout:
-        return jsonify({"success": False, "error": "Request timed out"}), 408
+        return _json_response(_TIMEOUT_BODY, 408)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_grok_api_key(api_key: str):
     """Test Grok (xAI) API key."""
     try:
-        response = requests.post(
-            "https://api.x.ai/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "grok-5",
-                "messages": [{"role": "user", "content": "Hi"}],
-                "max_tokens": 5,
-            },
+        # Listing models validates the key without a billable completion
+        response = requests.get(
+            "https://api.x.ai/v1/models",
+            headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
         )
         if response.status_code == 200:
-            return jsonify({"success": True, "message": "Grok API key is valid"}), 200
+            return _json_response(_GROK_OK_BODY, 200)
         else:
             error_msg = "Unknown error"
             try:
@@ -167,11 +181,11 @@ def test_grok_api_key(api_key: str):
                 )
             except Exception:
                 pass
-            return jsonify({"success": False, "error": f"API Error: {error_msg}"}), 400
+            return _error(f"API Error: {error_msg}")
     except requests.Timeout:
-        return jsonify({"success": False, "error": "Request timed out"}), 408
+        return _json_response(_TIMEOUT_BODY, 408)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_openrouter_api_key(api_key: str):
@@ -181,49 +195,34 @@ def test_openrouter_api_key(api_key: str):
             "https://openrouter.ai/api/v1/models",
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
+            stream=True,
         )
         if response.status_code == 200:
-            return (
-                jsonify({"success": True, "message": "OpenRouter API key is valid"}),
-                200,
-            )
+            response.close()
+            return _json_response(_OPENROUTER_OK_BODY, 200)
         else:
-            return (
-                jsonify({"success": False, "error": f"API Error: {response.text}"}),
-                400,
-            )
+            return _error(f"API Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_deepseek_api_key(api_key: str):
     """Test DeepSeek API key."""
     try:
-        response = requests.post(
-            "https://api.deepseek.com/chat/completions",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "deepseek-chat",
-                "messages": [{"role": "user", "content": "Hi"}],
-                "max_tokens": 5,
-            },
+        # Listing models validates the key without a billable completion
+        response = requests.get(
+            "https://api.deepseek.com/v1/models",
+            headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
+            stream=True,
         )
         if response.status_code == 200:
-            return (
-                jsonify({"success": True, "message": "DeepSeek API key is valid"}),
-                200,
-            )
+            response.close()
+            return _json_response(_DEEPSEEK_OK_BODY, 200)
         else:
-            return (
-                jsonify({"success": False, "error": f"API Error: {response.text}"}),
-                400,
-            )
+            return _error(f"API Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_mistral_api_key(api_key: str):
@@ -233,19 +232,15 @@ def test_mistral_api_key(api_key: str):
             "https://api.mistral.ai/v1/models",
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
+            stream=True,
         )
         if response.status_code == 200:
-            return (
-                jsonify({"success": True, "message": "Mistral API key is valid"}),
-                200,
-            )
+            response.close()
+            return _json_response(_MISTRAL_OK_BODY, 200)
         else:
-            return (
-                jsonify({"success": False, "error": f"API Error: {response.text}"}),
-                400,
-            )
+            return _error(f"API Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_together_api_key(api_key: str):
@@ -255,19 +250,15 @@ def test_together_api_key(api_key: str):
             "https://api.together.xyz/v1/models",
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
+            stream=True,
         )
         if response.status_code == 200:
-            return (
-                jsonify({"success": True, "message": "Together AI API key is valid"}),
-                200,
-            )
+            response.close()
+            return _json_response(_TOGETHER_OK_BODY, 200)
         else:
-            return (
-                jsonify({"success": False, "error": f"API Error: {response.text}"}),
-                400,
-            )
+            return _error(f"API Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_huggingface_api_key(api_key: str):
@@ -277,19 +268,15 @@ def test_huggingface_api_key(api_key: str):
             "https://huggingface.co/api/whoami-v2",
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
+            stream=True,
         )
         if response.status_code == 200:
-            return (
-                jsonify({"success": True, "message": "Hugging Face API key is valid"}),
-                200,
-            )
+            response.close()
+            return _json_response(_HUGGINGFACE_OK_BODY, 200)
         else:
-            return (
-                jsonify({"success": False, "error": f"API Error: {response.text}"}),
-                400,
-            )
+            return _error(f"API Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_zhipu_api_key(api_key: str):
@@ -301,45 +288,38 @@ def test_zhipu_api_key(api_key: str):
             "https://open.bigmodel.cn/api/paas/v4/model",
             headers={"Authorization": f"Bearer {api_key}"},
             timeout=10,
+            stream=True,
         )
         if response.status_code == 200:
-            return jsonify({"success": True, "message": "Zhipu AI API key is valid"}), 200
+            response.close()
+            return _json_response(_ZHIPU_OK_BODY, 200)
         else:
-            return (
-                jsonify({"success": False, "error": f"API Error: {response.text}"}),
-                400,
-            )
+            return _error(f"API Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 400
+        return _error(str(e))
 
 
 def test_lmstudio_api_key(url: str):
     """Test LM Studio connection."""
     try:
-        response = requests.get(f"{url}/v1/models", timeout=5)
+        response = requests.get(f"{url}/v1/models", timeout=5, stream=True)
         if response.status_code == 200:
-            return jsonify({"success": True, "message": "LM Studio is accessible"}), 200
+            response.close()
+            return _json_response(_LMSTUDIO_OK_BODY, 200)
         else:
-            return (
-                jsonify(
-                    {"success": False, "error": f"LM Studio Error: {response.text}"}
-                ),
-                400,
-            )
+            return _error(f"LM Studio Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": f"Connection failed: {str(e)}"}), 400
+        return _error(f"Connection failed: {str(e)}")
 
 
 def test_localai_api_key(url: str):
     """Test LocalAI connection."""
     try:
-        response = requests.get(f"{url}/v1/models", timeout=5)
+        response = requests.get(f"{url}/v1/models", timeout=5, stream=True)
         if response.status_code == 200:
-            return jsonify({"success": True, "message": "LocalAI is accessible"}), 200
+            response.close()
+            return _json_response(_LOCALAI_OK_BODY, 200)
         else:
-            return (
-                jsonify({"success": False, "error": f"LocalAI Error: {response.text}"}),
-                400,
-            )
+            return _error(f"LocalAI Error: {_body_excerpt(response)}")
     except Exception as e:
-        return jsonify({"success": False, "error": f"Connection failed: {str(e)}"}), 400
+        return _error(f"Connection failed: {str(e)}")
@@ -3,6 +3,20 @@
 import re
 from typing import Union
 
+# Substrings that any of the cleanup rules below can act on. Messages without
+# them pass through the regex pipeline unchanged.
+_SANITIZE_TRIGGERS = re.compile(
+    r"https?://|\[type=|input_|For further|validation error"
+)
+
+
+def _simple_or_generic(error_msg: str) -> str:
+    """Keep short, link-free messages; replace anything else with a generic one."""
+    if len(error_msg) < 100 and "http" not in error_msg.lower():
+        return error_msg.strip()
+
+    return "Invalid input provided. Please check your data and try again."
+
 
 def sanitize_validation_error(error: Union[str, Exception]) -> str:
     """
@@ -16,6 +30,10 @@ def sanitize_validation_error(error: Union[str, Exception]) -> str:
     """
     error_msg = str(error)
 
+    # Fast path: nothing for the cleanup rules to strip
+    if not _SANITIZE_TRIGGERS.search(error_msg):
+        return _simple_or_generic(error_msg)
+
     # Remove Pydantic URLs and documentation links
     error_msg = re.sub(r"https?://[^\s]+", "", error_msg)
 
@@ -54,10 +72,7 @@ def sanitize_validation_error(error: Union[str, Exception]) -> str:
 
     # If we can't parse it nicely, return a generic message
     # but try to preserve the core error if it's simple
-    if len(error_msg) < 100 and "http" not in error_msg.lower():
-        return error_msg.strip()
-
-    return "Invalid input provided. Please check your data and try again."
+    return _simple_or_generic(error_msg)
 
 
 def sanitize_pydantic_error(exception: Exception) -> str:
@@ -5,8 +5,8 @@ Pytest configuration and fixtures for testing
 import pytest
 import os
 import sys
-import tempfile
-import shutil
+import sqlite3
+import uuid
 from pathlib import Path
 
 # Add src to path
@@ -19,26 +19,61 @@ from src.models.profile import Profile
 from src.services.encryption_service import EncryptionService
 
 
-@pytest.fixture(scope="session")
-def test_db_dir():
-    """Create temporary directory for test databases."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+# Upper bound for `-n auto`; each worker boots its own Flask app and SQLite files
+MAX_XDIST_WORKERS = 8
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Cap the worker count pytest-xdist picks for `-n auto`."""
+    return max(1, min(os.cpu_count() or 1, MAX_XDIST_WORKERS))
+
+
+# bcrypt hashes by plaintext, shared by every test in the session
+_PASSWORD_HASH_CACHE = {}
+
+
+def _install_cached_hash_password():
+    """Memoize User.hash_password so each test password is hashed only once.
+
+    bcrypt is deliberately slow, and test_db reloads src.auth.models (and with
+    it the User class) for every test, so this is re-applied after each reload.
+    """
+    user_cls = sys.modules["src.auth.models"].User
+    original = user_cls.__dict__["hash_password"].__func__
+    if getattr(original, "_test_cached", False):
+        return
+
+    def cached_hash_password(password: str) -> str:
+        if password not in _PASSWORD_HASH_CACHE:
+            _PASSWORD_HASH_CACHE[password] = original(password)
+        return _PASSWORD_HASH_CACHE[password]
+
+    cached_hash_password._test_cached = True
+    user_cls.hash_password = staticmethod(cached_hash_password)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cache_hash_password():
+    """Apply the hash_password cache for tests that don't use test_db."""
+    _install_cached_hash_password()
 
 
 @pytest.fixture(scope="function")
-def test_db(test_db_dir, request):
-    """Create a fresh test database for each test."""
-    # Create unique database file for each test
-    test_name = request.node.name
-    db_path = os.path.join(test_db_dir, f"{test_name}.db")
+def test_db():
+    """Create a fresh in-memory test database for each test."""
+    # Unique shared-cache in-memory database per test: every connection the
+    # app opens by this URI sees the same data, with no disk I/O. Test names
+    # repeat across modules, so name it randomly rather than after the test.
+    db_path = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
 
     # Set environment variable for test database
     os.environ["DATABASE_PATH"] = db_path
 
-    # Initialize database
-    test_db_instance = Database(db_path)
+    # Initialize database. An in-memory database is dropped when its last
+    # connection closes, so hold one open for the duration of the test.
+    test_db_instance = Database(db_path, uri=True)
+    keepalive_conn = sqlite3.connect(db_path, uri=True)
 
     # Update the global db instance to use test database
     # This ensures all imports of `db` use the test database
@@ -69,6 +104,7 @@ def test_db(test_db_dir, request):
         importlib.reload(sys.modules['src.services.user_backup_service'])
     if 'src.services.selective_backup_service' in sys.modules:
         importlib.reload(sys.modules['src.services.selective_backup_service'])
+    _install_cached_hash_password()
 
     # Create tables
     with test_db_instance.get_connection() as conn:
@@ -101,7 +137,9 @@ def test_db(test_db_dir, request):
                 email_verified BOOLEAN DEFAULT 0,
                 email_verification_sent_at TEXT,
                 temp_recovery_code TEXT,
-                recovery_code_shown BOOLEAN DEFAULT 0
+                recovery_code_shown BOOLEAN DEFAULT 0,
+                api_keys TEXT,
+                api_keys_iv TEXT
             )
         """)
 
@@ -389,14 +427,12 @@ def test_db(test_db_dir, request):
     # Restore original db
     connection_module.db = original_db
 
-    # Cleanup database file
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    # Closing the last connection frees the in-memory database
+    keepalive_conn.close()
 
 
-@pytest.fixture(scope="function")
-def app(test_db):
-    """Create Flask app for testing."""
+def _create_test_app():
+    """Build a Flask app configured for testing."""
     app = create_app("testing")
     app.config["TESTING"] = True
     app.config["WTF_CSRF_ENABLED"] = False  # Disable CSRF for testing
@@ -405,6 +441,23 @@ def app(test_db):
     return app
 
 
+@pytest.fixture(scope="function")
+def app(test_db):
+    """Create Flask app for testing."""
+    return _create_test_app()
+
+
+@pytest.fixture(scope="module")
+def module_app():
+    """Flask app shared by every test in a module.
+
+    Modules whose tests don't change app config can override ``app`` to
+    return this and skip rebuilding the app per test. The database is still
+    per-test: request ``test_db`` (directly or via ``test_user``) as usual.
+    """
+    return _create_test_app()
+
+
 @pytest.fixture(scope="function")
 def client(app):
     """Create Flask test client."""
@@ -497,6 +550,16 @@ def auth_headers(client, test_user):
     return {"Cookie": response.headers.get("Set-Cookie")}
 
 
+@pytest.fixture(scope="function")
+def logged_in_client(client, test_user):
+    """Test client with an active session for the test user."""
+    response = client.post(
+        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
+    )
+    assert response.status_code == 200
+    return client
+
+
 @pytest.fixture(scope="function")
 def encryption_service():
     """Create encryption service for testing."""
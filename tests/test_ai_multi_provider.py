@@ -1,5 +1,6 @@
 import pytest
 import json
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from src.app import create_app
 from src.models.profile import Profile
@@ -23,11 +24,15 @@ def client(app):
 
 @pytest.fixture
 def mock_profile_data(monkeypatch):
-    profile = MagicMock()
-    profile.id = 1
-    profile.name = "test_profile"
-    profile.birth_date = "1980-01-01"
-    profile.retirement_date = "2045-01-01"
+    # Plain attributes only: the routes read these fields and never assert calls
+    profile = SimpleNamespace(
+        id=1,
+        user_id=1,
+        name="test_profile",
+        birth_date="1980-01-01",
+        retirement_date="2045-01-01",
+        data=None,
+    )
     profile.data_dict = {
         "api_keys": {
             "openai_api_key": "sk-test-key",
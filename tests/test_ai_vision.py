@@ -7,6 +7,23 @@ from flask_login import login_user, current_user
 from src.auth.models import User
 from src.models.profile import Profile
 
+# Minimal 1x1 transparent PNG
+_TINY_PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
+
+_EXTRACT_PAYLOAD_TEMPLATE = {
+    "image": _TINY_PNG_B64,
+    "mime_type": "image/png",
+    "profile_name": "testprofile",
+}
+
+_TEST_API_KEYS = {
+    "gemini_api_key": "test-gemini-key",
+    "claude_api_key": "test-claude-key",
+    "openai_api_key": "test-openai-key",
+    "ollama_url": "http://localhost:11434",
+    "ollama_model": "llama3.2-vision",
+}
+
 
 @pytest.fixture
 def auth_client(client, app):
@@ -20,15 +37,7 @@ def auth_client(client, app):
         
         # Create a test profile
         profile = Profile(id=1, user_id=1, name="testprofile")
-        profile.data_dict = {
-            "api_keys": {
-                "gemini_api_key": "test-gemini-key",
-                "claude_api_key": "test-claude-key",
-                "openai_api_key": "test-openai-key",
-                "ollama_url": "http://localhost:11434",
-                "ollama_model": "llama3.2-vision",
-            }
-        }
+        profile.data_dict = {"api_keys": dict(_TEST_API_KEYS)}
         profile.save() # Ensure profile is in test_db
 
         with patch("src.auth.models.User.get_by_id", return_value=user):
@@ -41,16 +50,14 @@ def auth_client(client, app):
 
 def parse_stream(response):
     """Helper to parse NDJSON stream from response."""
-    results = []
     full_data = {}
-    for line in response.data.decode("utf-8").split("\n"):
-        if line.strip():
-            try:
-                data = json.loads(line)
-                results.append(data)
-                full_data.update(data)
-            except json.JSONDecodeError:
-                continue
+    for raw in response.data.split(b"\n"):
+        if not raw.strip():
+            continue
+        try:
+            full_data.update(json.loads(raw))
+        except json.JSONDecodeError:
+            continue
     return full_data
 
 
@@ -60,19 +67,11 @@ def test_extract_items_assets_ollama(auth_client):
     mock_response.status_code = 200
     # Mocking generator/stream is tricky, ai_services.py uses a generator
     # For integration tests, we need to mock the internal call_llm or similar
-    
-    # Minimal 1x1 transparent PNG
-    valid_image = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg=="
 
     with patch("src.routes.ai_services.call_llm", return_value='[{"name": "401k", "type": "401k", "value": 100000, "institution": "Vanguard"}]'):
         response = auth_client.post(
             "/api/extract-items/assets",
-            json={
-                "image": valid_image,
-                "mime_type": "image/png",
-                "llm_provider": "ollama",
-                "profile_name": "testprofile",
-            },
+            json={**_EXTRACT_PAYLOAD_TEMPLATE, "llm_provider": "ollama"},
         )
     assert response.status_code == 200
     data = parse_stream(response)
@@ -88,12 +87,7 @@ def test_extract_items_assets_gemini(auth_client):
     ):
         response = auth_client.post(
             "/api/extract-items/assets",
-            json={
-                "image": "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg==",
-                "mime_type": "image/png",
-                "llm_provider": "gemini",
-                "profile_name": "testprofile",
-            },
+            json={**_EXTRACT_PAYLOAD_TEMPLATE, "llm_provider": "gemini"},
         )
     assert response.status_code == 200
     data = parse_stream(response)
@@ -108,12 +102,7 @@ def test_extract_items_assets_claude(auth_client):
     ):
         response = auth_client.post(
             "/api/extract-items/assets",
-            json={
-                "image": "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg==",
-                "mime_type": "image/png",
-                "llm_provider": "claude",
-                "profile_name": "testprofile",
-            },
+            json={**_EXTRACT_PAYLOAD_TEMPLATE, "llm_provider": "claude"},
         )
     assert response.status_code == 200
     data = parse_stream(response)
@@ -127,12 +116,7 @@ def test_extract_items_assets_openai(auth_client):
     ):
         response = auth_client.post(
             "/api/extract-items/assets",
-            json={
-                "image": "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8/5+hHgAHggJ/PchI7wAAAABJRU5ErkJggg==",
-                "mime_type": "image/png",
-                "llm_provider": "openai",
-                "profile_name": "testprofile",
-            },
+            json={**_EXTRACT_PAYLOAD_TEMPLATE, "llm_provider": "openai"},
         )
     assert response.status_code == 200
     data = parse_stream(response)
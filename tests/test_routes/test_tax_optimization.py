@@ -5,14 +5,9 @@ Integration tests for tax optimization routes
 import pytest
 
 
-def test_get_tax_snapshot(client, test_user, test_profile):
+def test_get_tax_snapshot(logged_in_client, test_profile):
     """Test getting tax snapshot."""
-    # Login
-    client.post(
-        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
-    )
-
-    response = client.post(
+    response = logged_in_client.post(
         "/api/tax-optimization/snapshot", json={"profile_name": "Test Profile"}
     )
 
@@ -24,14 +19,9 @@ def test_get_tax_snapshot(client, test_user, test_profile):
     assert "profile_name" in data
 
 
-def test_analyze_comprehensive(client, test_user, test_profile):
+def test_analyze_comprehensive(logged_in_client, test_profile):
     """Test comprehensive tax analysis."""
-    # Login
-    client.post(
-        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
-    )
-
-    response = client.post(
+    response = logged_in_client.post(
         "/api/tax-optimization/analyze",
         json={"profile_name": "Test Profile", "filing_status": "mfj", "state": "CA"},
     )
@@ -45,14 +35,9 @@ def test_analyze_comprehensive(client, test_user, test_profile):
     assert "recommendations" in data
 
 
-def test_analyze_roth_conversion(client, test_user, test_profile):
+def test_analyze_roth_conversion(logged_in_client, test_profile):
     """Test Roth conversion analysis."""
-    # Login
-    client.post(
-        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
-    )
-
-    response = client.post(
+    response = logged_in_client.post(
         "/api/tax-optimization/roth-conversion",
         json={"profile_name": "Test Profile", "filing_status": "mfj"},
     )
@@ -64,14 +49,9 @@ def test_analyze_roth_conversion(client, test_user, test_profile):
     assert "profile_name" in data
 
 
-def test_analyze_social_security(client, test_user, test_profile):
+def test_analyze_social_security(logged_in_client, test_profile):
     """Test Social Security timing analysis."""
-    # Login
-    client.post(
-        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
-    )
-
-    response = client.post(
+    response = logged_in_client.post(
         "/api/tax-optimization/social-security-timing",
         json={"profile_name": "Test Profile", "life_expectancy": 90},
     )
@@ -84,14 +64,9 @@ def test_analyze_social_security(client, test_user, test_profile):
     assert "profile_name" in data
 
 
-def test_state_comparison(client, test_user, test_profile):
+def test_state_comparison(logged_in_client, test_profile):
     """Test state tax comparison."""
-    # Login
-    client.post(
-        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
-    )
-
-    response = client.post(
+    response = logged_in_client.post(
         "/api/tax-optimization/state-comparison", json={"profile_name": "Test Profile"}
     )
 
@@ -103,14 +78,9 @@ def test_state_comparison(client, test_user, test_profile):
     assert len(data["comparison"]) > 0
 
 
-def test_rmd_projection(client, test_user, test_profile):
+def test_rmd_projection(logged_in_client, test_profile):
     """Test RMD projection."""
-    # Login
-    client.post(
-        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
-    )
-
-    response = client.post(
+    response = logged_in_client.post(
         "/api/tax-optimization/rmd-projection",
         json={"profile_name": "Test Profile", "growth_rate": 0.05, "years": 20},
     )
@@ -133,14 +103,9 @@ def test_tax_optimization_requires_auth(client):
     assert response.status_code == 302
 
 
-def test_tax_optimization_missing_profile(client, test_user):
+def test_tax_optimization_missing_profile(logged_in_client):
     """Test tax optimization with non-existent profile."""
-    # Login
-    client.post(
-        "/api/auth/login", json={"username": "testuser", "password": "TestPass123"}
-    )
-
-    response = client.post(
+    response = logged_in_client.post(
         "/api/tax-optimization/snapshot", json={"profile_name": "Nonexistent Profile"}
     )
 
@@ -5,28 +5,26 @@ from src.auth.models import User
 
 class TestSecurityComprehensive:
 
-    def test_unauthorized_access(self, client):
-        """Test that critical endpoints reject unauthenticated requests."""
-        endpoints = [
+    @pytest.mark.parametrize(
+        "method, url",
+        [
             ("GET", "/api/profiles"),
             ("POST", "/api/profiles"),
             ("GET", "/api/profile/SomeName"),
             ("POST", "/api/advisor/chat"),
             ("POST", "/api/extract-items/assets"),
             ("GET", "/api/admin/users"),
-        ]
-
-        for method, url in endpoints:
-            if method == "GET":
-                response = client.get(url)
-            else:
-                response = client.post(url)
-
-            # Should be 401 Unauthorized or 302 Redirect to login
-            assert response.status_code in [
-                401,
-                302,
-            ], f"Endpoint {url} accessible without auth"
+        ],
+    )
+    def test_unauthorized_access(self, client, method, url):
+        """Test that critical endpoints reject unauthenticated requests."""
+        response = client.open(url, method=method)
+
+        # Should be 401 Unauthorized or 302 Redirect to login
+        assert response.status_code in [
+            401,
+            302,
+        ], f"Endpoint {url} accessible without auth"
 
     def test_profile_ownership_isolation(self, client, test_db):
         """Test that users cannot access each other's profiles."""
@@ -1,7 +1,9 @@
 """Tests for RetirementModel withdrawal logic and tax calculations."""
 
+import copy
 from datetime import datetime
 import numpy as np
+import pytest
 from src.services.retirement_model import (
     Person,
     FinancialProfile,
@@ -35,6 +37,18 @@ def _create_basic_model():
     return RetirementModel(profile)
 
 
+@pytest.fixture(scope="module")
+def _basic_model_template():
+    """Basic RetirementModel built once per module; copied for each test."""
+    return _create_basic_model()
+
+
+@pytest.fixture
+def basic_model(_basic_model_template):
+    """Per-test copy of the basic model, so tests may modify it freely."""
+    return copy.deepcopy(_basic_model_template)
+
+
 def test_rmd_calculation():
     p1 = Person("P1", datetime(1950, 1, 1), datetime(2015, 1, 1), 2000)
     p2 = Person("P2", datetime(1950, 1, 1), datetime(2015, 1, 1), 2000)
@@ -66,6 +80,14 @@ def test_rmd_calculation():
     assert round(rmd) == 42194
 
 
+def test_rmd_divisor_outside_table(basic_model):
+    """Fractional ages and ages past 90 fall back to the last divisor (12.2)."""
+    assert basic_model.calculate_rmd(72.9, 1000000) == 0
+    assert basic_model.calculate_rmd(75.0, 1000000) == 1000000 / 24.6
+    assert basic_model.calculate_rmd(75.5, 1000000) == 1000000 / 12.2
+    assert basic_model.calculate_rmd(95, 1000000) == 1000000 / 12.2
+
+
 def test_monte_carlo_with_budget():
     p1 = Person("P1", datetime(1980, 1, 1), datetime(2045, 1, 1), 0)
     p2 = Person("P2", datetime(1980, 1, 1), datetime(2045, 1, 1), 0)
@@ -129,6 +151,19 @@ def test_monte_carlo_with_budget():
     assert result["starting_portfolio"] == 100000
 
 
+def test_monte_carlo_rng_reproducible(basic_model):
+    """Passing a seeded Generator makes the simulation reproducible."""
+    first = basic_model.monte_carlo_simulation(
+        years=15, simulations=50, rng=np.random.default_rng(7)
+    )
+    second = basic_model.monte_carlo_simulation(
+        years=15, simulations=50, rng=np.random.default_rng(7)
+    )
+
+    assert first["timeline"] == second["timeline"]
+    assert first["success_rate"] == second["success_rate"]
+
+
 # =========================================================================
 # Tax Function Tests
 # =========================================================================
@@ -137,40 +172,36 @@ def test_monte_carlo_with_budget():
 class TestProgressiveFederalTax:
     """Tests for _vectorized_federal_tax function."""
 
-    def test_low_income_10_percent_bracket(self):
+    def test_low_income_10_percent_bracket(self, basic_model):
         """Income under $23,200 should be taxed at 10%."""
-        model = _create_basic_model()
         income = np.array([20000.0])
-        tax, marginal = model._vectorized_federal_tax(income, "mfj")
+        tax, marginal = basic_model._vectorized_federal_tax(income, "mfj")
         assert tax[0] == 2000.0  # 20,000 * 0.10
         assert marginal[0] == 0.10
 
-    def test_middle_income_progressive(self):
+    def test_middle_income_progressive(self, basic_model):
         """Income of $50,000 spans 10% and 12% brackets."""
-        model = _create_basic_model()
         income = np.array([50000.0])
-        tax, marginal = model._vectorized_federal_tax(income, "mfj")
+        tax, marginal = basic_model._vectorized_federal_tax(income, "mfj")
         # First $23,200 at 10% = $2,320
         # Remaining $26,800 at 12% = $3,216
         expected = 23200 * 0.10 + (50000 - 23200) * 0.12
         assert abs(tax[0] - expected) < 1  # Allow for rounding
         assert marginal[0] == 0.12
 
-    def test_high_income_top_brackets(self):
+    def test_high_income_top_brackets(self, basic_model):
         """Income of $800,000 should hit 37% bracket."""
-        model = _create_basic_model()
         income = np.array([800000.0])
-        tax, marginal = model._vectorized_federal_tax(income, "mfj")
+        tax, marginal = basic_model._vectorized_federal_tax(income, "mfj")
         assert marginal[0] == 0.37
         # Effective rate should be between 22% and 37%
         effective_rate = tax[0] / 800000
         assert 0.22 < effective_rate < 0.37
 
-    def test_vectorized_multiple_incomes(self):
+    def test_vectorized_multiple_incomes(self, basic_model):
         """Test with multiple income values simultaneously."""
-        model = _create_basic_model()
         incomes = np.array([10000.0, 50000.0, 200000.0, 500000.0])
-        taxes, marginals = model._vectorized_federal_tax(incomes, "mfj")
+        taxes, marginals = basic_model._vectorized_federal_tax(incomes, "mfj")
 
         # Each should have increasing tax
         assert taxes[0] < taxes[1] < taxes[2] < taxes[3]
@@ -181,32 +212,29 @@ class TestProgressiveFederalTax:
 class TestSocialSecurityTaxation:
     """Tests for _vectorized_taxable_ss function."""
 
-    def test_below_first_threshold_zero_taxable(self):
+    def test_below_first_threshold_zero_taxable(self, basic_model):
         """Provisional income below $32K (MFJ) = 0% taxable."""
-        model = _create_basic_model()
         other_income = np.array([10000.0])  # Low AGI
         ss_benefit = np.array([20000.0])  # $20K SS
         # Provisional = 10000 + 0.5*20000 = 20000 < 32000
-        taxable = model._vectorized_taxable_ss(other_income, ss_benefit, "mfj")
+        taxable = basic_model._vectorized_taxable_ss(other_income, ss_benefit, "mfj")
         assert taxable[0] == 0.0
 
-    def test_between_thresholds_partial_taxable(self):
+    def test_between_thresholds_partial_taxable(self, basic_model):
         """Provisional income between $32K-$44K = up to 50% taxable."""
-        model = _create_basic_model()
         other_income = np.array([25000.0])
         ss_benefit = np.array([24000.0])
         # Provisional = 25000 + 0.5*24000 = 37000 (between 32K and 44K)
-        taxable = model._vectorized_taxable_ss(other_income, ss_benefit, "mfj")
+        taxable = basic_model._vectorized_taxable_ss(other_income, ss_benefit, "mfj")
         # Taxable should be > 0 but < 50% of benefits
         assert 0 < taxable[0] < ss_benefit[0] * 0.5
 
-    def test_above_second_threshold_85_percent_taxable(self):
+    def test_above_second_threshold_85_percent_taxable(self, basic_model):
         """Provisional income above $44K (MFJ) = up to 85% taxable."""
-        model = _create_basic_model()
         other_income = np.array([100000.0])  # High AGI
         ss_benefit = np.array([30000.0])
         # Provisional = 100000 + 0.5*30000 = 115000 >> 44000
-        taxable = model._vectorized_taxable_ss(other_income, ss_benefit, "mfj")
+        taxable = basic_model._vectorized_taxable_ss(other_income, ss_benefit, "mfj")
         # Should be 85% of benefits (max taxable)
         assert abs(taxable[0] - ss_benefit[0] * 0.85) < 1
 
@@ -214,39 +242,35 @@ class TestSocialSecurityTaxation:
 class TestLongTermCapitalGainsTax:
     """Tests for _vectorized_ltcg_tax function."""
 
-    def test_zero_percent_bracket(self):
+    def test_zero_percent_bracket(self, basic_model):
         """Low income + gains should be taxed at 0%."""
-        model = _create_basic_model()
         gains = np.array([50000.0])
         ordinary_income = np.array([40000.0])  # Below $94,050 threshold
-        tax = model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
+        tax = basic_model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
         # Total income = 90000, all in 0% bracket
         assert tax[0] == 0.0
 
-    def test_fifteen_percent_bracket(self):
+    def test_fifteen_percent_bracket(self, basic_model):
         """Middle income should be taxed at 15%."""
-        model = _create_basic_model()
         gains = np.array([50000.0])
         ordinary_income = np.array([200000.0])  # Above 0% threshold
-        tax = model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
+        tax = basic_model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
         # All gains in 15% bracket
         assert tax[0] == 50000 * 0.15
 
-    def test_twenty_percent_bracket(self):
+    def test_twenty_percent_bracket(self, basic_model):
         """Very high income should be taxed at 20%."""
-        model = _create_basic_model()
         gains = np.array([100000.0])
         ordinary_income = np.array([600000.0])  # Above $583,750 threshold
-        tax = model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
+        tax = basic_model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
         # All gains in 20% bracket
         assert tax[0] == 100000 * 0.20
 
-    def test_income_stacking(self):
+    def test_income_stacking(self, basic_model):
         """Gains should stack on ordinary income."""
-        model = _create_basic_model()
         gains = np.array([50000.0, 50000.0])
         ordinary_income = np.array([40000.0, 600000.0])
-        taxes = model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
+        taxes = basic_model._vectorized_ltcg_tax(gains, ordinary_income, "mfj")
         # First case: 0% rate (low income)
         # Second case: 20% rate (high income stacking)
         assert taxes[0] < taxes[1]
@@ -255,53 +279,47 @@ class TestLongTermCapitalGainsTax:
 class TestIRMAASurcharges:
     """Tests for _vectorized_irmaa function."""
 
-    def test_no_surcharge_low_income(self):
+    def test_no_surcharge_low_income(self, basic_model):
         """MAGI below $206K should have no IRMAA surcharge."""
-        model = _create_basic_model()
         magi = np.array([150000.0])
-        irmaa = model._vectorized_irmaa(magi, "mfj", both_on_medicare=True)
+        irmaa = basic_model._vectorized_irmaa(magi, "mfj", both_on_medicare=True)
         assert irmaa[0] == 0.0
 
-    def test_tier_1_surcharge(self):
+    def test_tier_1_surcharge(self, basic_model):
         """MAGI $206K-$258K should have Tier 1 surcharge."""
-        model = _create_basic_model()
         magi = np.array([230000.0])
-        irmaa = model._vectorized_irmaa(magi, "mfj", both_on_medicare=True)
+        irmaa = basic_model._vectorized_irmaa(magi, "mfj", both_on_medicare=True)
         # Tier 1: $839.40 per person, doubled for couple
         assert irmaa[0] == 839.40 * 2
 
-    def test_top_tier_surcharge(self):
+    def test_top_tier_surcharge(self, basic_model):
         """MAGI above $750K should have Tier 5 surcharge."""
-        model = _create_basic_model()
         magi = np.array([800000.0])
-        irmaa = model._vectorized_irmaa(magi, "mfj", both_on_medicare=True)
+        irmaa = basic_model._vectorized_irmaa(magi, "mfj", both_on_medicare=True)
         # Tier 5: $5030.40 per person, doubled for couple
         assert irmaa[0] == 5030.40 * 2
 
-    def test_single_person_on_medicare(self):
+    def test_single_person_on_medicare(self, basic_model):
         """Single person should get single surcharge (not doubled)."""
-        model = _create_basic_model()
         magi = np.array([230000.0])
-        irmaa = model._vectorized_irmaa(magi, "mfj", both_on_medicare=False)
+        irmaa = basic_model._vectorized_irmaa(magi, "mfj", both_on_medicare=False)
         assert irmaa[0] == 839.40  # Not doubled
 
 
 class TestEmploymentTax:
     """Tests for _calculate_employment_tax function."""
 
-    def test_fica_calculation(self):
+    def test_fica_calculation(self, basic_model):
         """FICA should be 7.65% (SS 6.2% + Medicare 1.45%)."""
-        model = _create_basic_model()
         income = np.array([50000.0])
-        tax = model._calculate_employment_tax(income, state_rate=0)
+        tax = basic_model._calculate_employment_tax(income, state_rate=0)
         # At $50K, FICA = 50000 * 0.0765 = 3825
         # Plus federal tax on (50000 - 29200 std deduction)
         fica_portion = 50000 * 0.0765
         assert tax[0] > fica_portion  # Should include federal too
 
-    def test_ss_wage_base_cap(self):
+    def test_ss_wage_base_cap(self, basic_model):
         """SS tax should cap at wage base ($168,600 in 2024)."""
-        model = _create_basic_model()
         # Income below SS wage base ($168,600)
         below_cap = np.array([100000.0])
         # Income above SS wage base
@@ -313,8 +331,8 @@ class TestEmploymentTax:
         # Without cap, $200K would have SS = $12,400
 
         # Calculate difference in total tax between two incomes
-        tax_100k = model._calculate_employment_tax(below_cap, state_rate=0)
-        tax_200k = model._calculate_employment_tax(above_cap, state_rate=0)
+        tax_100k = basic_model._calculate_employment_tax(below_cap, state_rate=0)
+        tax_200k = basic_model._calculate_employment_tax(above_cap, state_rate=0)
 
         # The SS portion difference should be less than 100000 * 0.062 = $6,200
         # because the cap kicks in at $168,600
@@ -324,12 +342,11 @@ class TestEmploymentTax:
         assert tax_100k[0] > 0
         assert tax_200k[0] > tax_100k[0]
 
-    def test_state_tax_included(self):
+    def test_state_tax_included(self, basic_model):
         """State tax should be included when rate > 0."""
-        model = _create_basic_model()
         income = np.array([100000.0])
-        tax_no_state = model._calculate_employment_tax(income, state_rate=0)
-        tax_with_state = model._calculate_employment_tax(income, state_rate=0.05)
+        tax_no_state = basic_model._calculate_employment_tax(income, state_rate=0)
+        tax_with_state = basic_model._calculate_employment_tax(income, state_rate=0.05)
         expected_state = 100000 * 0.05
         assert abs((tax_with_state[0] - tax_no_state[0]) - expected_state) < 1
 
@@ -376,10 +393,9 @@ class TestRMDDoubleCounting:
 class TestFullSimulationIntegration:
     """Integration tests for full Monte Carlo simulation."""
 
-    def test_simulation_runs_without_error(self):
+    def test_simulation_runs_without_error(self, basic_model):
         """Simulation should complete without errors."""
-        model = _create_basic_model()
-        result = model.monte_carlo_simulation(
+        result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=100,
             assumptions=MarketAssumptions(),
@@ -389,17 +405,16 @@ class TestFullSimulationIntegration:
         assert result["starting_portfolio"] > 0
         assert len(result["timeline"]["years"]) == 20
 
-    def test_progressive_taxes_affect_results(self):
+    def test_progressive_taxes_affect_results(self, basic_model):
         """Progressive taxes should produce different results than flat rate."""
-        model = _create_basic_model()
 
         # Run with default effective_tax_rate (22%)
-        np.random.seed(42)  # For reproducibility
-        result = model.monte_carlo_simulation(
+        result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=100,
             assumptions=MarketAssumptions(),
             effective_tax_rate=0.22,
+            rng=np.random.default_rng(42),
         )
 
         # The simulation now uses progressive taxes internally
@@ -416,9 +431,8 @@ class TestFullSimulationIntegration:
 class TestMarketPeriodsValidation:
     """Tests for _validate_market_periods function."""
 
-    def test_no_warnings_for_reasonable_timeline(self):
+    def test_no_warnings_for_reasonable_timeline(self, basic_model):
         """Reasonable timeline periods should produce no warnings."""
-        model = _create_basic_model()
         periods = {
             "type": "timeline",
             "periods": [
@@ -448,13 +462,12 @@ class TestMarketPeriodsValidation:
                 },
             ],
         }
-        warnings = model._validate_market_periods(30, periods)
+        warnings = basic_model._validate_market_periods(30, periods)
         assert isinstance(warnings, list)
         assert len(warnings) == 0
 
-    def test_warns_on_prolonged_recession(self):
+    def test_warns_on_prolonged_recession(self, basic_model):
         """Should warn about recessions lasting more than 5 years."""
-        model = _create_basic_model()
         periods = {
             "type": "timeline",
             "periods": [
@@ -472,13 +485,12 @@ class TestMarketPeriodsValidation:
                 }
             ],
         }
-        warnings = model._validate_market_periods(30, periods)
+        warnings = basic_model._validate_market_periods(30, periods)
         assert len(warnings) > 0
         assert any("recession" in w.lower() for w in warnings)
 
-    def test_warns_on_prolonged_bull_market(self):
+    def test_warns_on_prolonged_bull_market(self, basic_model):
         """Should warn about bull markets lasting more than 15 years."""
-        model = _create_basic_model()
         periods = {
             "type": "timeline",
             "periods": [
@@ -496,13 +508,12 @@ class TestMarketPeriodsValidation:
                 }
             ],
         }
-        warnings = model._validate_market_periods(30, periods)
+        warnings = basic_model._validate_market_periods(30, periods)
         assert len(warnings) > 0
         assert any("bull market" in w.lower() for w in warnings)
 
-    def test_warns_on_single_long_period(self):
+    def test_warns_on_single_long_period(self, basic_model):
         """Should warn when single period covers 80%+ of retirement."""
-        model = _create_basic_model()
         periods = {
             "type": "timeline",
             "periods": [
@@ -520,13 +531,12 @@ class TestMarketPeriodsValidation:
                 }
             ],
         }
-        warnings = model._validate_market_periods(30, periods)
+        warnings = basic_model._validate_market_periods(30, periods)
         assert len(warnings) > 0
         assert any("single market condition" in w.lower() for w in warnings)
 
-    def test_detects_timeline_gaps(self):
+    def test_detects_timeline_gaps(self, basic_model):
         """Should detect gaps in timeline coverage."""
-        model = _create_basic_model()
         periods = {
             "type": "timeline",
             "periods": [
@@ -556,13 +566,12 @@ class TestMarketPeriodsValidation:
                 },
             ],
         }
-        warnings = model._validate_market_periods(30, periods)
+        warnings = basic_model._validate_market_periods(30, periods)
         assert len(warnings) > 0
         assert any("gap" in w.lower() for w in warnings)
 
-    def test_warns_on_short_cycle(self):
+    def test_warns_on_short_cycle(self, basic_model):
         """Should warn about very short market cycles."""
-        model = _create_basic_model()
         periods = {
             "type": "cycle",
             "repeat": True,
@@ -591,7 +600,7 @@ class TestMarketPeriodsValidation:
                 },
             ],
         }
-        warnings = model._validate_market_periods(30, periods)
+        warnings = basic_model._validate_market_periods(30, periods)
         assert len(warnings) > 0
         assert any("short" in w.lower() or "cycle" in w.lower() for w in warnings)
 
@@ -599,24 +608,24 @@ class TestMarketPeriodsValidation:
 class TestBuildPeriodAssumptionsLookup:
     """Tests for _build_period_assumptions_lookup function."""
 
-    def test_returns_default_when_no_periods(self):
+    def test_returns_default_when_no_periods(self, basic_model):
         """Should return default assumptions for all years when no periods specified."""
-        model = _create_basic_model()
         default_assumptions = MarketAssumptions(
             stock_return_mean=0.10, bond_return_mean=0.04
         )
 
-        lookup = model._build_period_assumptions_lookup(10, None, default_assumptions)
+        lookup = basic_model._build_period_assumptions_lookup(
+            10, None, default_assumptions
+        )
 
         assert len(lookup) == 10
         for year in range(10):
             assert lookup[year].stock_return_mean == 0.10
             assert lookup[year].bond_return_mean == 0.04
 
-    def test_timeline_periods_mapped_correctly(self):
+    def test_timeline_periods_mapped_correctly(self, basic_model):
         """Timeline periods should map to correct years."""
-        model = _create_basic_model()
-        current_year = model.current_year
+        current_year = basic_model.current_year
 
         periods = {
             "type": "timeline",
@@ -648,7 +657,7 @@ class TestBuildPeriodAssumptionsLookup:
             ],
         }
 
-        lookup = model._build_period_assumptions_lookup(
+        lookup = basic_model._build_period_assumptions_lookup(
             10, periods, MarketAssumptions()
         )
 
@@ -661,9 +670,8 @@ class TestBuildPeriodAssumptionsLookup:
         assert lookup[3].stock_return_mean == 0.18
         assert lookup[9].stock_return_mean == 0.18
 
-    def test_cycle_pattern_repeats_correctly(self):
+    def test_cycle_pattern_repeats_correctly(self, basic_model):
         """Cycle pattern should repeat when repeat=True."""
-        model = _create_basic_model()
 
         periods = {
             "type": "cycle",
@@ -694,7 +702,7 @@ class TestBuildPeriodAssumptionsLookup:
             ],
         }
 
-        lookup = model._build_period_assumptions_lookup(
+        lookup = basic_model._build_period_assumptions_lookup(
             15, periods, MarketAssumptions()
         )
 
@@ -714,9 +722,8 @@ class TestBuildPeriodAssumptionsLookup:
         assert lookup[10].stock_return_mean == 0.18
         assert lookup[13].stock_return_mean == 0.02
 
-    def test_cycle_pattern_stops_when_no_repeat(self):
+    def test_cycle_pattern_stops_when_no_repeat(self, basic_model):
         """Cycle pattern should stop after one cycle when repeat=False."""
-        model = _create_basic_model()
         default_assumptions = MarketAssumptions(stock_return_mean=0.10)
 
         periods = {
@@ -737,7 +744,7 @@ class TestBuildPeriodAssumptionsLookup:
             ],
         }
 
-        lookup = model._build_period_assumptions_lookup(
+        lookup = basic_model._build_period_assumptions_lookup(
             10, periods, default_assumptions
         )
 
@@ -749,13 +756,12 @@ class TestBuildPeriodAssumptionsLookup:
         assert lookup[3].stock_return_mean == 0.10
         assert lookup[9].stock_return_mean == 0.10
 
-    def test_fills_gaps_with_default_assumptions(self):
+    def test_fills_gaps_with_default_assumptions(self, basic_model):
         """Timeline gaps should be filled with default assumptions."""
-        model = _create_basic_model()
         default_assumptions = MarketAssumptions(
             stock_return_mean=0.10, bond_return_mean=0.04
         )
-        current_year = model.current_year
+        current_year = basic_model.current_year
 
         periods = {
             "type": "timeline",
@@ -787,7 +793,7 @@ class TestBuildPeriodAssumptionsLookup:
             ],
         }
 
-        lookup = model._build_period_assumptions_lookup(
+        lookup = basic_model._build_period_assumptions_lookup(
             10, periods, default_assumptions
         )
 
@@ -799,10 +805,9 @@ class TestBuildPeriodAssumptionsLookup:
 class TestMonteCarloWithMarketPeriods:
     """Integration tests for Monte Carlo simulation with market periods."""
 
-    def test_simulation_with_timeline_periods(self):
+    def test_simulation_with_timeline_periods(self, basic_model):
         """Simulation should complete successfully with timeline periods."""
-        model = _create_basic_model()
-        current_year = model.current_year
+        current_year = basic_model.current_year
 
         periods = {
             "type": "timeline",
@@ -834,7 +839,7 @@ class TestMonteCarloWithMarketPeriods:
             ],
         }
 
-        result = model.monte_carlo_simulation(
+        result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=100,
             assumptions=MarketAssumptions(),
@@ -846,9 +851,8 @@ class TestMonteCarloWithMarketPeriods:
         assert len(result["timeline"]["years"]) == 20
         assert "warnings" in result
 
-    def test_simulation_with_cycle_periods(self):
+    def test_simulation_with_cycle_periods(self, basic_model):
         """Simulation should complete successfully with cycle periods."""
-        model = _create_basic_model()
 
         periods = {
             "type": "cycle",
@@ -879,7 +883,7 @@ class TestMonteCarloWithMarketPeriods:
             ],
         }
 
-        result = model.monte_carlo_simulation(
+        result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=100,
             assumptions=MarketAssumptions(),
@@ -890,10 +894,9 @@ class TestMonteCarloWithMarketPeriods:
         assert result["starting_portfolio"] > 0
         assert len(result["timeline"]["years"]) == 20
 
-    def test_early_crash_worse_than_late_crash(self):
+    def test_early_crash_worse_than_late_crash(self, basic_model):
         """Early retirement crash should produce worse success rate than late crash."""
-        model = _create_basic_model()
-        current_year = model.current_year
+        current_year = basic_model.current_year
 
         # Early crash scenario
         early_crash_periods = {
@@ -957,39 +960,38 @@ class TestMonteCarloWithMarketPeriods:
             ],
         }
 
-        np.random.seed(42)
-        early_result = model.monte_carlo_simulation(
+        early_result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=500,
             assumptions=MarketAssumptions(),
             market_periods=early_crash_periods,
+            rng=np.random.default_rng(42),
         )
 
-        np.random.seed(42)
-        late_result = model.monte_carlo_simulation(
+        late_result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=500,
             assumptions=MarketAssumptions(),
             market_periods=late_crash_periods,
+            rng=np.random.default_rng(42),
         )
 
         # Early crash should have worse success rate (sequence of returns risk)
         assert early_result["success_rate"] < late_result["success_rate"]
 
-    def test_periods_produce_different_results_than_simple(self):
+    def test_periods_produce_different_results_than_simple(self, basic_model):
         """Period-based simulation should produce different results than simple mode."""
-        model = _create_basic_model()
-        current_year = model.current_year
+        current_year = basic_model.current_year
 
         # Simple mode: recession for entire period (unrealistic)
-        np.random.seed(42)
-        simple_result = model.monte_carlo_simulation(
+        simple_result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=200,
             assumptions=MarketAssumptions(
                 stock_return_mean=0.02, stock_return_std=0.22
             ),
             market_periods=None,
+            rng=np.random.default_rng(42),
         )
 
         # Period mode: realistic cycle
@@ -1022,12 +1024,12 @@ class TestMonteCarloWithMarketPeriods:
             ],
         }
 
-        np.random.seed(42)
-        period_result = model.monte_carlo_simulation(
+        period_result = basic_model.monte_carlo_simulation(
             years=20,
             simulations=200,
             assumptions=MarketAssumptions(),
             market_periods=periods,
+            rng=np.random.default_rng(42),
         )
 
         # Results should be significantly different
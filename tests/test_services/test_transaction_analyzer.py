@@ -117,6 +117,21 @@ class TestSanitizeTransaction:
         assert "1234567890" not in sanitized.description
         assert "STORE NAME" in sanitized.description.upper()
 
+    def test_remove_non_ascii_account_numbers(self):
+        """Account numbers in other digit scripts are removed too."""
+        account = "\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\uff10"
+        txn = Transaction(
+            date=date(2024, 1, 15),
+            description=f"PAYMENT {account} STORE NAME",
+            amount=100.00,
+            original_description=f"PAYMENT {account} STORE NAME",
+        )
+
+        sanitized = sanitize_transaction(txn)
+
+        assert account not in sanitized.description
+        assert "STORE NAME" in sanitized.description.upper()
+
     def test_remove_tracking_codes(self):
         """Test removal of tracking codes."""
         txn = Transaction(